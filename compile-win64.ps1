@@ -57,8 +57,11 @@ if ($LASTEXITCODE -ne 0) {
     if ($LASTEXITCODE -ne 0) { throw "Nuitka-Installation fehlgeschlagen" }
 }
 
+# no_docstrings: Docstrings werden zur Laufzeit nirgends gelesen - ohne sie
+# ist das Bundle kleiner und beim Start sind weniger Konstanten zu laden.
 & $python -m nuitka `
     --standalone `
+    --python-flag=no_docstrings `
     --assume-yes-for-downloads `
     --remove-output `
     --include-package=console_error_scanner `
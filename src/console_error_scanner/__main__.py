@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import argparse
 import os
 import sys
 from typing import TextIO
@@ -10,21 +9,21 @@ from typing import TextIO
 # Frozen-EXE Erkennung (PyInstaller UND Nuitka):
 # PLAYWRIGHT_BROWSERS_PATH muss gesetzt werden BEVOR playwright importiert wird,
 # damit das gebundelte Chromium im "browsers"-Unterordner gefunden wird.
+# Ist die Variable schon gesetzt (vom Nutzer oder vom Elternprozess geerbt),
+# entfaellt die Pruefung samt stat() - Kindprozesse erben das Ergebnis.
 _is_frozen = getattr(sys, "frozen", False) or "__compiled__" in globals()
-if _is_frozen:
-    _exe_dir = os.path.dirname(sys.executable)
-    _browsers_dir = os.path.join(_exe_dir, "browsers")
+if _is_frozen and "PLAYWRIGHT_BROWSERS_PATH" not in os.environ:
+    _browsers_dir = os.path.join(os.path.dirname(sys.executable), "browsers")
     if os.path.isdir(_browsers_dir):
         os.environ["PLAYWRIGHT_BROWSERS_PATH"] = _browsers_dir
 
-from textual_widgets import reset_terminal_title, set_terminal_title
-
 # Log-Handle offen halten, solange der Prozess laeuft - faulthandler schreibt
 # beim fatalen Signal direkt hinein. Ohne Referenz wuerde der GC es schliessen.
 _fault_log: TextIO | None = None
 
 from console_error_scanner import __version__
-from console_error_scanner.i18n import SUPPORTED_LANGUAGES, load_locale
+from console_error_scanner._cli import answer_without_parser, parse_args
+from console_error_scanner.i18n import load_locale, t
 from console_error_scanner.models.settings import Settings
 
 
@@ -57,121 +56,13 @@ def main() -> None:
     _enable_faulthandler()
     _silence_proactor_teardown_noise()
 
+    if answer_without_parser(sys.argv[1:]):
+        return
+
     settings = Settings.load()
     saved_lang = settings.language
 
-    parser = argparse.ArgumentParser(
-        prog="console-error-scanner",
-        description=f"\n  Console Error Scanner v{__version__}\n",
-        epilog=_usage_examples(),
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-
-    parser.add_argument(
-        "sitemap_url",
-        nargs="?",
-        default="",
-        metavar="URL_OR_FILE",
-        help=(
-            "URL der Website, Sitemap-URL oder lokale sitemap.xml. "
-            "Bei Domain-URLs wird die Sitemap automatisch gesucht. "
-            "Ohne Argument fragt die App die URL beim ersten 's' ab."
-        ),
-    )
-    parser.add_argument(
-        "--concurrency",
-        "-c",
-        type=int,
-        default=None,
-        metavar="N",
-        help="Max parallele Browser-Tabs (Default aus Settings)",
-    )
-    parser.add_argument(
-        "--timeout",
-        "-t",
-        type=int,
-        default=None,
-        metavar="SEC",
-        help="Timeout pro Seite in Sekunden (Default aus Settings)",
-    )
-    parser.add_argument(
-        "--output-json",
-        default="",
-        metavar="PATH",
-        help="JSON-Report automatisch speichern",
-    )
-    parser.add_argument(
-        "--output-html",
-        default="",
-        metavar="PATH",
-        help="HTML-Report automatisch speichern",
-    )
-    parser.add_argument(
-        "--no-headless",
-        action="store_true",
-        default=False,
-        help="Browser sichtbar starten (Debugging)",
-    )
-    parser.add_argument(
-        "--filter",
-        "-f",
-        default="",
-        metavar="TEXT",
-        help="Nur URLs scannen die TEXT enthalten",
-    )
-    parser.add_argument(
-        "--console-level",
-        default="",
-        choices=["", "error", "warn", "all"],
-        metavar="LEVEL",
-        help="Console-Level: error | warn | all (Default aus Settings)",
-    )
-    parser.add_argument(
-        "--user-agent",
-        default="",
-        metavar="UA",
-        help="Custom User-Agent String (Default: realistischer Chrome)",
-    )
-    parser.add_argument(
-        "--cookie",
-        action="append",
-        default=[],
-        metavar="NAME=VALUE",
-        help="Cookie setzen (mehrfach moeglich). Default aus Settings.",
-    )
-    parser.add_argument(
-        "--whitelist",
-        "-w",
-        default="",
-        metavar="PATH",
-        help="Pfad zur Whitelist-JSON (Default aus Settings)",
-    )
-    parser.add_argument(
-        "--no-consent",
-        action="store_true",
-        default=None,
-        help="Cookie-Consent NICHT akzeptieren (nur Banner verstecken)",
-    )
-    parser.add_argument(
-        "--no-scroll",
-        action="store_true",
-        default=None,
-        help="Seite nicht scrollen (kein Lazy-Loading-Trigger)",
-    )
-    parser.add_argument(
-        "--ignore-robots",
-        action="store_true",
-        default=None,
-        help="robots.txt ignorieren (nur fuer eigene Seiten sinnvoll)",
-    )
-    parser.add_argument(
-        "--lang",
-        default=saved_lang,
-        choices=SUPPORTED_LANGUAGES,
-        help=f"Language ({', '.join(SUPPORTED_LANGUAGES)})",
-    )
-
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:], default_lang=saved_lang)
 
     # Sprache laden (CLI > Settings > Default)
     lang = args.lang
@@ -185,12 +76,10 @@ def main() -> None:
     # Cookies parsen: "NAME=VALUE" -> {"name": "NAME", "value": "VALUE"}
     cookies = []
     for cookie_str in args.cookie:
-        if "=" not in cookie_str:
-            from console_error_scanner.i18n import t
-
-            print(t("cli.invalid_cookie", cookie=cookie_str))
+        name, sep, value = cookie_str.partition("=")
+        if not sep:
+            sys.stderr.write(t("cli.invalid_cookie", cookie=cookie_str) + "\n")
             sys.exit(1)
-        name, value = cookie_str.split("=", 1)
         cookies.append({"name": name.strip(), "value": value.strip()})
 
     # textual-image (TGP/Sixel) eager initialisieren, sobald das Terminal
@@ -199,7 +88,11 @@ def main() -> None:
     # Vorschau in den fokussierten Input (Filter-Suche).
     _preinit_graphics_backend()
 
-    # App NACH load_locale importieren - t() ist sofort verfuegbar
+    # App (und der ganze Textual-/Playwright-Importgraph) erst NACH dem Parsen
+    # und NACH load_locale importieren: --help und Argumentfehler kommen so ohne
+    # den schweren Import aus, und t() ist beim App-Import sofort verfuegbar.
+    from textual_widgets import reset_terminal_title, set_terminal_title
+
     from console_error_scanner.app import ConsoleErrorScannerApp
 
     set_terminal_title(f"✗ console-error-scanner v{__version__}")
@@ -276,23 +169,6 @@ def _terminal_supports_graphics() -> bool:
     return term in ("foot", "xterm", "mlterm", "mintty") or "foot" in term
 
 
-def _usage_examples() -> str:
-    """Gibt die Nutzungsbeispiele zurueck."""
-    return """
-Examples:
-  console-error-scanner https://example.com
-  console-error-scanner https://example.com/sitemap.xml
-  console-error-scanner sitemap.xml
-  console-error-scanner https://example.com --concurrency 12
-  console-error-scanner https://example.com --lang en
-
-Keybindings (TUI):
-  c = Crawl       m = Load sitemap   r = Report     h = History    s = Settings
-  w = Whitelist   e = Errors only    t = Theme      l = Log
-  d = Copy detail F10 = Top 10       / = Filter     i = Info       q = Quit
-"""
-
-
 def _enable_faulthandler() -> None:
     """Faengt HARTE Abstuerze ab, die an Pythons Exception-Handling UND am
     finally-Block vorbeilaufen: native Access Violation, Stack-Overflow, fataler
@@ -0,0 +1,321 @@
+"""Kommandozeile: Optionstabelle, Parser und vorformatierte Hilfe.
+
+Bewusst ohne argparse und ohne schwere Importe - ``__main__`` beantwortet
+--help/--version und Aufruffehler, bevor Textual oder Playwright geladen sind.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+from dataclasses import dataclass, field
+from typing import NoReturn
+
+from console_error_scanner import __version__
+from console_error_scanner.i18n import SUPPORTED_LANGUAGES
+
+# Nutzungsbeispiele - Epilog der Hilfe.
+USAGE_EXAMPLES = """
+Examples:
+  console-error-scanner https://example.com
+  console-error-scanner https://example.com/sitemap.xml
+  console-error-scanner sitemap.xml
+  console-error-scanner https://example.com --concurrency 12
+  console-error-scanner https://example.com --lang en
+
+Keybindings (TUI):
+  c = Crawl       m = Load sitemap   r = Report     h = History    s = Settings
+  w = Whitelist   e = Errors only    t = Theme      l = Log
+  d = Copy detail F10 = Top 10       / = Filter     i = Info       q = Quit
+"""
+
+USAGE = f"""usage: console-error-scanner [-h] [--version] [--concurrency N]
+                             [--timeout SEC] [--output-json PATH]
+                             [--output-html PATH] [--no-headless]
+                             [--filter TEXT]
+                             [--console-level LEVEL] [--user-agent UA]
+                             [--cookie NAME=VALUE] [--whitelist PATH]
+                             [--no-consent] [--no-scroll] [--ignore-robots]
+                             [--lang {{{",".join(SUPPORTED_LANGUAGES)}}}]
+                             [URL_OR_FILE]
+"""
+
+
+@functools.cache
+def help_text() -> str:
+    """Liefert die vorformatierte Hilfe (Layout wie argparse).
+
+    Erst beim ersten --help zusammengesetzt - normale Starts brauchen sie
+    nie. Wer in OPTIONS eine Option ergaenzt, ergaenzt sie auch hier und
+    in USAGE.
+    """
+    return f"""{USAGE}
+  Console Error Scanner v{__version__}
+
+positional arguments:
+  URL_OR_FILE           URL der Website, Sitemap-URL oder lokale sitemap.xml.
+                        Bei Domain-URLs wird die Sitemap automatisch gesucht.
+                        Ohne Argument fragt die App die URL beim ersten 's'
+                        ab.
+
+options:
+  -h, --help            show this help message and exit
+  --version             show program's version number and exit
+  --concurrency, -c N   Max parallele Browser-Tabs (Default aus Settings)
+  --timeout, -t SEC     Timeout pro Seite in Sekunden (Default aus Settings)
+  --output-json PATH    JSON-Report automatisch speichern
+  --output-html PATH    HTML-Report automatisch speichern
+  --no-headless         Browser sichtbar starten (Debugging)
+  --filter, -f TEXT     Nur URLs scannen die TEXT enthalten
+  --console-level LEVEL
+                        Console-Level: error | warn | all (Default aus
+                        Settings)
+  --user-agent UA       Custom User-Agent String (Default: realistischer
+                        Chrome)
+  --cookie NAME=VALUE   Cookie setzen (mehrfach moeglich). Default aus
+                        Settings.
+  --whitelist, -w PATH  Pfad zur Whitelist-JSON (Default aus Settings)
+  --no-consent          Cookie-Consent NICHT akzeptieren (nur Banner
+                        verstecken)
+  --no-scroll           Seite nicht scrollen (kein Lazy-Loading-Trigger)
+  --ignore-robots       robots.txt ignorieren (nur fuer eigene Seiten
+                        sinnvoll)
+  --lang {{{",".join(SUPPORTED_LANGUAGES)}}}        Language ({", ".join(SUPPORTED_LANGUAGES)})
+{USAGE_EXAMPLES}"""
+
+
+# Der --help-/--version-Pfad schreibt direkt in den Byte-Puffer von stdout,
+# ohne Codec-Schicht. Beide Texte sind reines ASCII, das passt zu jeder
+# Konsolen-Codepage.
+VERSION_BYTES = f"console-error-scanner {__version__}\n".encode("ascii")
+
+# Option -> (Zielfeld in CliArgs, Art). Art: "int", "str", "append" oder
+# "flag" (ohne Wert). Die CLI ist flach - keine Subkommandos, keine
+# Gruppen -, dafuer reicht eine Schleife ueber argv statt argparse.
+OPTIONS: dict[str, tuple[str, str]] = {
+    "--concurrency": ("concurrency", "int"),
+    "-c": ("concurrency", "int"),
+    "--timeout": ("timeout", "int"),
+    "-t": ("timeout", "int"),
+    "--output-json": ("output_json", "str"),
+    "--output-html": ("output_html", "str"),
+    "--no-headless": ("no_headless", "flag"),
+    "--filter": ("filter", "str"),
+    "-f": ("filter", "str"),
+    "--console-level": ("console_level", "str"),
+    "--user-agent": ("user_agent", "str"),
+    "--cookie": ("cookie", "append"),
+    "--whitelist": ("whitelist", "str"),
+    "-w": ("whitelist", "str"),
+    "--no-consent": ("no_consent", "flag"),
+    "--no-scroll": ("no_scroll", "flag"),
+    "--ignore-robots": ("ignore_robots", "flag"),
+    "--lang": ("lang", "str"),
+}
+
+# Lange Optionen, auf die ein eindeutiger Praefix (``--conc``) aufgeloest wird -
+# wie argparse mit allow_abbrev. --help/--version zaehlen mit, damit ``--h``
+# nicht stillschweigend auf eine andere Option faellt.
+_LONG_OPTIONS = (*(name for name in OPTIONS if name.startswith("--")), "--help", "--version")
+
+# Leer = Default aus den Settings.
+CONSOLE_LEVELS = frozenset(("", "error", "warn", "all"))
+
+
+@dataclass
+class CliArgs:
+    """Ergebnis von parse_args.
+
+    Die drei abschaltenden Flags (no_consent, no_scroll, ignore_robots) sind
+    None, solange sie nicht angegeben wurden - dann gilt der Settings-Wert.
+    """
+
+    sitemap_url: str = ""
+    concurrency: int | None = None
+    timeout: int | None = None
+    output_json: str = ""
+    output_html: str = ""
+    no_headless: bool = False
+    filter: str = ""
+    console_level: str = ""
+    user_agent: str = ""
+    cookie: list[str] = field(default_factory=list)
+    whitelist: str = ""
+    no_consent: bool | None = None
+    no_scroll: bool | None = None
+    ignore_robots: bool | None = None
+    lang: str = ""
+
+
+def parse_args(argv: list[str], default_lang: str) -> CliArgs:
+    """Parst die Kommandozeile (ohne --help/--version, siehe answer_without_parser).
+
+    Versteht ``--option WERT``, ``--option=WERT``, ``-cWERT`` und eindeutig
+    abgekuerzte lange Optionen (``--conc 4``) - wie argparse.
+    Bei Fehlern endet der Prozess mit Exit-Code 2 und Meldung auf stderr.
+
+    Args:
+        argv:
+            Kommandozeilenargumente ohne Programmnamen.
+        default_lang:
+            Sprache ohne --lang (aus den Settings).
+
+    Returns:
+        Die geparsten Argumente.
+    """
+    args = CliArgs(lang=default_lang)
+    positional: list[str] = []
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        i += 1
+        if token == "--":
+            positional.extend(argv[i:])
+            break
+
+        inline: str | None = None
+        if token.startswith("--"):
+            name, sep, rest = token.partition("=")
+            if sep:
+                inline = rest
+            if name not in OPTIONS:
+                matches = _long_option_matches(name)
+                if len(matches) > 1:
+                    _cli_error(f"ambiguous option: {token} could match {', '.join(matches)}")
+                if matches:
+                    name = matches[0]
+        elif len(token) > 2 and token[:2] in OPTIONS:
+            name, inline = token[:2], token[2:]
+        else:
+            name = token
+
+        spec = OPTIONS.get(name)
+        if spec is None:
+            if name.startswith("-") and name != "-":
+                _cli_error(f"unrecognized arguments: {token}")
+            positional.append(token)
+            continue
+
+        dest, kind = spec
+        if kind == "flag":
+            if inline is not None:
+                _cli_error(f"argument {name}: ignored explicit argument '{inline}'")
+            setattr(args, dest, True)
+            continue
+
+        if inline is not None:
+            value = inline
+        elif i < len(argv) and not (argv[i].startswith("-") and argv[i] != "-" and not argv[i][1:].isdigit()):
+            value = argv[i]
+            i += 1
+        else:
+            _cli_error(f"argument {name}: expected one argument")
+
+        if kind == "int":
+            try:
+                setattr(args, dest, int(value))
+            except ValueError:
+                _cli_error(f"argument {name}: invalid int value: '{value}'")
+        elif kind == "append":
+            args.cookie.append(value)
+        else:
+            # Wie argparse nur den angegebenen Wert pruefen, nicht den Default:
+            # eine unbekannte Sprache aus settings.json faellt in load_locale
+            # auf die Standardsprache zurueck, statt jeden Start zu blockieren.
+            if dest == "lang" and value not in SUPPORTED_LANGUAGES:
+                _cli_error(f"argument --lang: invalid choice: '{value}' (choose from {', '.join(SUPPORTED_LANGUAGES)})")
+            setattr(args, dest, value)
+
+    if len(positional) > 1:
+        _cli_error(f"unrecognized arguments: {' '.join(positional[1:])}")
+    if positional:
+        args.sitemap_url = positional[0]
+    if args.console_level not in CONSOLE_LEVELS:
+        _cli_error(f"argument --console-level: invalid choice: '{args.console_level}' (choose from error, warn, all)")
+    return args
+
+
+def _long_option_matches(name: str) -> list[str]:
+    """Liefert die langen Optionen, die mit ``name`` beginnen.
+
+    Args:
+        name:
+            Option wie auf der Kommandozeile (ohne ``=WERT``).
+
+    Returns:
+        Passende Optionen in Tabellen-Reihenfolge; genau eine bei eindeutigem Praefix.
+    """
+    if len(name) < 3:  # "--" allein ist kein Praefix
+        return []
+    return [option for option in _LONG_OPTIONS if option.startswith(name)]
+
+
+def _cli_error(message: str) -> NoReturn:
+    """Meldet einen Aufruffehler wie argparse (Usage + Meldung, Exit 2)."""
+    sys.stderr.write(f"{USAGE}console-error-scanner: error: {message}\n")
+    sys.exit(2)
+
+
+def answer_without_parser(argv: list[str]) -> bool:
+    """Beantwortet --help und --version, ohne Settings zu laden oder zu parsen.
+
+    Beide Faelle brauchen nur einen festen Text.
+    Leere Argumente sind KEIN Hilfe-Fall: ohne URL startet die App und fragt
+    sie beim ersten 'c' ab.
+
+    Args:
+        argv:
+            Kommandozeilenargumente ohne Programmnamen.
+
+    Returns:
+        True, wenn die Anfrage beantwortet ist und main() enden soll.
+    """
+    requested: set[str] = set()
+    expects_value = False
+    for token in argv:
+        # Wert der vorigen Option (z.B. "--filter -h") ist keine Hilfe-Anfrage -
+        # das wird wie bei argparse ein Aufruffehler in parse_args.
+        if expects_value:
+            expects_value = False
+            continue
+        if token == "--":
+            break
+        if token == "-h":
+            requested.add("--help")
+            continue
+        if token.startswith("--"):
+            name, sep, _ = token.partition("=")
+            # Abkuerzungen wie "--hel" oder "--vers" gelten wie bei argparse mit.
+            matches = [name] if name in OPTIONS else _long_option_matches(name)
+            if len(matches) != 1:
+                continue
+            name = matches[0]
+            requested.add(name)
+        elif len(token) == 2:
+            name, sep = token, ""
+        else:
+            continue
+        spec = OPTIONS.get(name)
+        expects_value = spec is not None and spec[1] != "flag" and not sep
+    if "--help" in requested:
+        _write_stdout_bytes(help_text().encode("ascii"))
+        return True
+    if "--version" in requested:
+        _write_stdout_bytes(VERSION_BYTES)
+        return True
+    return False
+
+
+def _write_stdout_bytes(data: bytes) -> None:
+    """Schreibt vorkodierte Bytes nach stdout.
+
+    Ohne Byte-Puffer (stdout ersetzt, z.B. durch ein StringIO in Tests)
+    geht der Text den normalen Weg.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode("ascii"))
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
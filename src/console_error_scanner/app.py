@@ -5,9 +5,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
-import re
+import threading
 import time
 import traceback
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
@@ -57,6 +58,14 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
     """TUI-Anwendung zum Scannen von Websites auf Console- und HTTP-Fehler."""
 
     CSS_PATH = "app.tcss"
+
+    # Haupt-Widgets, gesetzt in on_mount (siehe dort).
+    _results_table: ResultsTable
+    _summary_header: SummaryHeader
+    _stats_panel: StatsPanel
+    _scan_log: LogPanel
+    _preview_panel: PreviewPanel
+    _log_splitter: HorizontalSplitter
     TITLE = f"Console Error Scanner v{__version__}"
 
     BINDINGS = [
@@ -131,6 +140,10 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
         # Persistierte Einstellungen laden
         self._settings = Settings.load()
+        # Beilaeufige Aenderungen (Theme) werden gebuendelt und im Hintergrund
+        # gespeichert; das Lock verhindert zwei gleichzeitige Schreibvorgaenge.
+        self._settings_lock = threading.Lock()
+        self._settings_save_timer: Timer | None = None
 
         # Zustimmung zum Haftungshinweis liegt neben den Einstellungen.
         self._disclaimer = DisclaimerStore(SETTINGS_FILE.parent / "disclaimer.json")
@@ -168,6 +181,8 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
         self._urls: list[str] = []
         self._results: list[ScanResult] = []
+        # Host der geladenen Sitemap, fertig fuer Report-Dateinamen bereinigt.
+        self._sitemap_hostname: str = ""
         self._scanner: Scanner | None = None
         self._whitelist: Whitelist | None = None
         # Aktionen des Whitelist-Kontextmenues (Index -> (kind, pattern)).
@@ -183,7 +198,21 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self._scan_start_time: float = 0
         self._scan_current: int = 0
         self._scan_total: int = 0
+        # (current, total) der zuletzt angezeigten Fortschrittszeile - der Timer
+        # formatiert nur neu, wenn seitdem eine Seite fertig geworden ist.
+        self._last_progress_key: tuple[int, int] = (-1, -1)
         self._scan_progress_timer: Timer | None = None
+        # Live-Ergebnisse seit dem letzten UI-Abgleich (id -> Ergebnis). Tabelle,
+        # Header und Statistik werden hoechstens alle _UI_FLUSH_INTERVAL Sekunden
+        # nachgezogen statt bei jeder einzelnen fertigen Seite.
+        self._dirty_results: dict[int, ScanResult] = {}
+        self._ui_flush_timer: Timer | None = None
+        # Noch nicht geschriebene Log-Zeilen - siehe _write_log.
+        self._log_buffer: list[str] = []
+        self._log_flush_timer: Timer | None = None
+        # Thread der Event-Loop (in on_mount bestaetigt). Puffer und Timer
+        # duerfen nur dort angefasst werden.
+        self._ui_thread_id: int = threading.get_ident()
         # Startklar nach Sitemap-Laden / History-Auswahl -> Footer-Taste "c"
         # blinkt, bis der Scan startet.
         self._scan_ready: bool = False
@@ -193,9 +222,16 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self._apply_binding_i18n()
 
     def _apply_binding_i18n(self) -> None:
-        """Setzt uebersetzte Description + Tooltip auf jedes Footer-Binding."""
-        for bindings_list in self._bindings.key_to_bindings.values():
+        """Setzt uebersetzte Description + Tooltip auf jedes Footer-Binding.
+
+        Merkt sich dabei, wo jede Aktion in der Binding-Map steht (Aktion ->
+        [(Taste, Index)]) - spaetere Label-Wechsel brauchen dann keine Suche.
+        """
+        self._binding_slots: dict[str, list[tuple[str, int]]] = {}
+        self._binding_variants: dict[tuple[str, int, str], Binding] = {}
+        for key, bindings_list in self._bindings.key_to_bindings.items():
             for i, binding in enumerate(bindings_list):
+                self._binding_slots.setdefault(binding.action, []).append((key, i))
                 key_i18n = self._BINDING_I18N.get(binding.action)
                 if key_i18n is None:
                     continue
@@ -205,6 +241,23 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
                     tooltip=t(f"tooltip.{key_i18n}"),
                 )
 
+    def _set_binding_description(self, action: str, description: str) -> None:
+        """Setzt die Footer-Beschriftung aller Tasten einer Aktion.
+
+        Args:
+            action: Aktionsname, z.B. "toggle_errors".
+            description: Neuer Footer-Text.
+        """
+        key_to_bindings = self._bindings.key_to_bindings
+        for key, i in self._binding_slots.get(action, ()):
+            # Binding ist frozen - jede Beschriftung wird einmal erzeugt und
+            # danach nur noch eingehaengt (Umschalten hin und her allokiert nichts).
+            variant = self._binding_variants.get((key, i, description))
+            if variant is None:
+                variant = dataclasses.replace(key_to_bindings[key][i], description=description)
+                self._binding_variants[(key, i, description)] = variant
+            key_to_bindings[key][i] = variant
+
     def compose(self) -> ComposeResult:
         """Erstellt das UI-Layout."""
         yield Header()
@@ -282,10 +335,22 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def on_mount(self) -> None:
         """Initialisierung nach dem Starten."""
+        # Die Haupt-Widgets einmal nachschlagen: sie leben so lange wie die App,
+        # und die Live-Updates waehrend eines Scans sparen sich so die
+        # Selektor-Suche. query_one saehe ausserdem nur den aktiven Screen -
+        # bei offenem Dialog liefe jede Suche ins Leere.
+        self._results_table = self.query_one("#results-table", ResultsTable)
+        self._summary_header = self.query_one("#summary", SummaryHeader)
+        self._stats_panel = self.query_one("#stats-panel", StatsPanel)
+        self._scan_log = self.query_one("#scan-log", LogPanel)
+        self._ui_thread_id = threading.get_ident()
+        self._preview_panel = self.query_one("#preview-panel", PreviewPanel)
+        self._log_splitter = self.query_one("#log-splitter", HorizontalSplitter)
+
         # Preview-Panel nur einblenden, wenn die Vorschau aktiviert ist -
         # der Splitter ueber dem StatsPanel verschwindet dann mit.
         with contextlib.suppress(Exception):
-            self.query_one("#preview-panel", PreviewPanel).display = self.show_preview
+            self._preview_panel.display = self.show_preview
             self.query_one("#preview-splitter", HorizontalSplitter).display = self.show_preview
 
         # Versionsinfo + Konfiguration ins Log
@@ -331,7 +396,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
         # Gross-Seiten-Schwellwert an die Tabelle geben (vor dem ersten Laden).
         with contextlib.suppress(Exception):
-            self.query_one("#results-table", ResultsTable).set_size_warn_mb(self.size_warn_mb)
+            self._results_table.set_size_warn_mb(self.size_warn_mb)
 
         # Blinkender Footer-Hinweis lenkt den Blick auf die naechste sinnvolle
         # Aktion: ist nach Sitemap-Laden / History-Auswahl startklar, blinkt "c".
@@ -408,6 +473,30 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self._sitemap_dots = 0
         self.refresh_bindings()
 
+    def _reuse_results(self, urls: list[str]) -> bool:
+        """Baut ``self._results`` fuer die URLs auf und nutzt vorhandene Objekte weiter.
+
+        Bei unveraenderter URL-Liste bleibt sogar die Liste selbst erhalten, sonst
+        werden nur die Objekte bekannter URLs uebernommen. Alle Ergebnisse stehen
+        danach im Ausgangszustand (PENDING, ohne Fehler).
+
+        Args:
+            urls:
+                Die URLs der frisch geladenen Sitemap.
+
+        Returns:
+            True wenn ein Ergebnis vorher schon Scan-Daten hatte.
+        """
+        if [result.url for result in self._results] != urls:
+            known = {result.url: result for result in self._results}
+            # pop: doppelte URLs bekommen je ein eigenes Objekt
+            self._results = [known.pop(url, None) or ScanResult(url=url) for url in urls]
+        dirty = False
+        for result in self._results:
+            dirty = dirty or result.status is not PageStatus.PENDING or bool(result.errors)
+            result.reset()
+        return dirty
+
     @work(exclusive=True, group="sitemap")
     async def _load_sitemap(self) -> None:
         """Laedt die Sitemap und zeigt die URLs an."""
@@ -438,6 +527,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
                 self.sitemap_url, url_filter=self.url_filter, cookies=self.cookies, proxy=self.proxy_url
             )
             self._urls = await parser.parse()
+            self._sitemap_hostname = _sanitize_filename(urlparse(self.sitemap_url).hostname or "unknown")
         except SitemapError as e:
             self._stop_sitemap_loading()
             self._write_log(f"[red]{t('log.sitemap_error', error=e)}[/red]")
@@ -477,13 +567,24 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             self.notify(t("notify.no_urls"), severity="warning")
             return
 
-        self._results = [ScanResult(url=url) for url in self._urls]
+        same_urls = [result.url for result in self._results] == self._urls
+        dirty = self._reuse_results(self._urls)
 
-        summary = self.query_one("#summary", SummaryHeader)
+        summary = self._summary_header
         summary.set_sitemap(self.link_markup(self.sitemap_url, self.sitemap_url), len(self._urls))
 
-        table = self.query_one("#results-table", ResultsTable)
-        table.load_results(self._results)
+        # Neue URL-Liste: Zeilen portionsweise einfuegen, damit grosse Sitemaps
+        # die Oberflaeche nicht sekundenlang einfrieren. Gleiche Sitemap erneut
+        # geladen (z.B. ueber die History): die Tabelle zeigt schon genau diese
+        # Objekte - nur zurueckgesetzte Zeilen neu schreiben.
+        table = self._results_table
+        if not same_urls:
+            await table.load_results_chunked(self._results)
+        elif dirty:
+            table.reset_rows(self._results)
+            # Das In-place-Reset markiert keine Zeile neu - das Stats-Panel
+            # zeigt sonst noch den alten Stand der markierten Seite.
+            self._stats_panel.refresh_view()
 
         self.sub_title = t("subtitle.urls_count", count=len(self._urls))
 
@@ -585,10 +686,11 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self._scan_running = True
         self._scan_cancelled = False
         self._scan_ready = False
-        self._scan_start_time = time.monotonic()
+        self._scan_start_time = time.perf_counter()
         self.refresh_bindings()  # 'x Scan abbrechen' einblenden, 'c' ausblenden
         self._scan_current = 0
         self._scan_total = len(self._results)
+        self._last_progress_key = (-1, -1)
         self._scan_progress_timer = self.set_interval(0.5, self._tick_scan_progress)
 
         # Laufende Preview-Worker abbrechen + Panel leeren - das Sidecar-
@@ -599,25 +701,30 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             if getattr(worker, "group", None) == "preview":
                 worker.cancel()
         with contextlib.suppress(Exception):
-            self.query_one("#preview-panel", PreviewPanel).clear()
+            self._preview_panel.clear()
 
         # Log-Panel einblenden + leeren
-        log_panel = self.query_one("#scan-log", LogPanel)
+        log_panel = self._scan_log
         log_panel.show()
+        # Gepufferte Zeilen des Vorlaufs gehoeren nicht mehr ins neue Log.
+        self._log_buffer.clear()
         log_panel.clear_log()
-        self.query_one("#log-splitter", HorizontalSplitter).remove_class("hidden")
+        self._log_splitter.remove_class("hidden")
 
         # Ergebnisse zuruecksetzen (gleiche Objekte behalten!)
         for result in self._results:
-            result.status = PageStatus.PENDING
-            result.http_status_code = 0
-            result.load_time_ms = 0
-            result.page_size_bytes = 0
-            result.errors.clear()
-            result.retry_count = 0
-
-        table = self.query_one("#results-table", ResultsTable)
-        table.load_results(self._results)
+            result.reset()
+
+        # Die Tabelle zeigt schon genau diese Ergebnis-Objekte - Zeilen in-place
+        # zuruecksetzen statt die DataTable neu aufzubauen.
+        self._results_table.reset_rows(self._results)
+        # Auch das Stats-Panel zeigt die markierte Seite zurueckgesetzt - sonst
+        # bleibt dort der Vorlauf stehen und der Fingerprint-Vergleich beim
+        # ersten Live-Update verschluckt die Neuzeichnung.
+        self._stats_panel.refresh_view()
+        # Header-Zaehler auf die zurueckgesetzten Ergebnisse abgleichen - die
+        # Live-Updates waehrend des Scans rechnen nur noch Differenzen.
+        self._summary_header.update_from_results(self._results)
 
         # History-Eintrag speichern
         with contextlib.suppress(Exception):
@@ -650,22 +757,12 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             rate_per_minute=self.rate_per_minute,
         )
 
-        def on_result(result: ScanResult) -> None:
-            self._on_scan_result(result)
-
-        def on_log(msg: str) -> None:
-            self._write_log(msg)
-
-        def on_progress(current: int, total: int) -> None:
-            self._scan_current = current
-            self._scan_total = total
-
         try:
             await self._scanner.scan_urls(
                 self._results,
-                on_result=on_result,
-                on_log=on_log,
-                on_progress=on_progress,
+                on_result=self._on_scan_result,
+                on_log=self._write_log,
+                on_progress=self._on_scan_progress,
             )
         except Exception as e:
             self._write_log(f"[red]{t('log.sitemap_error', error=e)}[/red]")
@@ -673,6 +770,10 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         finally:
             self._scan_running = False
             self._scanner = None
+            # Letzte Ergebnisse und Logzeilen des Laufs sofort zeigen - nicht erst
+            # mit dem naechsten Timer-Tick, wenn schon die Auswertung laeuft.
+            self._flush_scan_results()
+            self._flush_log()
             if self._scan_progress_timer is not None:
                 self._scan_progress_timer.stop()
                 self._scan_progress_timer = None
@@ -684,17 +785,17 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         if self._scan_cancelled:
             # Seiten, die beim Abbruch mitten im Laden waren, stehen sonst dauerhaft
             # auf "wird gescannt" - sie wurden aber nicht geprueft.
-            for result in self._results:
-                if result.status is PageStatus.SCANNING:
-                    result.status = PageStatus.PENDING
-            self.query_one("#results-table", ResultsTable).load_results(self._results)
+            interrupted = [r for r in self._results if r.status is PageStatus.SCANNING]
+            for result in interrupted:
+                result.status = PageStatus.PENDING
+            self._results_table.update_results(interrupted)
             scanned = sum(1 for r in self._results if r.status is not PageStatus.PENDING)
             self._write_log(f"[yellow]{t('log.scan_cancelled', count=scanned)}[/yellow]")
             self.notify(t("notify.scan_cancelled", count=scanned), severity="warning")
             self.sub_title = t("subtitle.cancelled")
             return
 
-        duration_ms = int((time.monotonic() - self._scan_start_time) * 1000)
+        duration_ms = int((time.perf_counter() - self._scan_start_time) * 1000)
         duration_text = _format_duration(duration_ms)
         summary_data = ScanSummary.from_results(self.sitemap_url, self._results, duration_ms)
 
@@ -714,12 +815,11 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         if summary_data.total_ignored > 0:
             self._write_log(f"[dim]{t('log.whitelist_suppressed', count=summary_data.total_ignored)}[/dim]")
 
-        # Tabelle final aktualisieren
-        table = self.query_one("#results-table", ResultsTable)
-        table.load_results(self._results)
+        # Die Tabelle ist ueber die Live-Updates (letzter Abgleich im finally
+        # oben) bereits auf dem Endstand - kein erneuter Aufbau noetig.
 
         # Summary aktualisieren
-        summary = self.query_one("#summary", SummaryHeader)
+        summary = self._summary_header
         summary.update_from_results(self._results, duration_text=duration_text)
 
         self.sub_title = t("subtitle.scan_complete", count=len(self._urls))
@@ -744,7 +844,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             self._refresh_preview_for_cursor()
 
         if self.output_json or self.output_html:
-            self._save_reports_auto(summary_data)
+            await self._save_reports_auto(summary_data)
 
         # Footer-Binding "z Zusammenfassung" jetzt aktivieren (Scan ist durch).
         self.refresh_bindings()
@@ -768,20 +868,48 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             return
         self._open_summary()
 
+    def _on_scan_progress(self, current: int, total: int) -> None:
+        """Merkt den Fortschritt; angezeigt wird er vom Timer (_tick_scan_progress)."""
+        self._scan_current = current
+        self._scan_total = total
+
     def _on_scan_result(self, result: ScanResult) -> None:
-        """Verarbeitet ein einzelnes Scan-Ergebnis (Live-Update)."""
+        """Verarbeitet ein einzelnes Scan-Ergebnis (Live-Update).
+
+        Die Whitelist greift sofort, die Anzeige wird nur vorgemerkt und
+        gebuendelt in _flush_scan_results nachgezogen.
+        """
         if self._whitelist is not None:
             self._whitelist.apply(result)
 
-        table = self.query_one("#results-table", ResultsTable)
-        table.update_result(result)
+        self._dirty_results[id(result)] = result
+        if self._ui_flush_timer is None:
+            self._ui_flush_timer = self.set_timer(_UI_FLUSH_INTERVAL, self._flush_scan_results)
+
+    def _flush_scan_results(self) -> None:
+        """Zieht Tabelle, Header und Statistik fuer alle vorgemerkten Ergebnisse nach."""
+        if self._ui_flush_timer is not None:
+            self._ui_flush_timer.stop()
+            self._ui_flush_timer = None
+        if not self._dirty_results:
+            return
+        batch = list(self._dirty_results.values())
+        self._dirty_results.clear()
+
+        # Jedes Widget einzeln absichern: der Header rechnet nur noch Differenzen
+        # nach - faellt sein Update wegen eines Tabellenfehlers aus, stimmen die
+        # Zaehler fuer den Rest des Scans nicht mehr.
+        with contextlib.suppress(Exception):
+            self._results_table.update_results(batch)
 
-        summary = self.query_one("#summary", SummaryHeader)
-        summary.update_from_results(self._results)
+        with contextlib.suppress(Exception):
+            self._summary_header.update_results(batch)
 
-        stats = self.query_one("#stats-panel", StatsPanel)
-        if stats.selected_result() is result:
-            stats.refresh_view()
+        with contextlib.suppress(Exception):
+            stats = self._stats_panel
+            selected = stats.selected_result()
+            if selected is not None and any(r is selected for r in batch):
+                stats.update_from_result(selected)
 
     def _tick_scan_progress(self) -> None:
         """Aktualisiert den Fortschrittsbalken im Header."""
@@ -795,10 +923,13 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
         current = self._scan_current
         total = self._scan_total
+        if (current, total) == self._last_progress_key:
+            return
+        self._last_progress_key = (current, total)
         bar = _format_progress_bar(current, total)
-        pct = int(current / total * 100) if total > 0 else 0
+        pct = current * 100 // total if total > 0 else 0
 
-        elapsed = time.monotonic() - self._scan_start_time
+        elapsed = time.perf_counter() - self._scan_start_time
         if current > 0:
             avg_per_url = elapsed / current
             remaining_s = avg_per_url * (total - current)
@@ -818,7 +949,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
     # --- Tabellen-Events ----------------------------------------------------
 
     def on_results_table_result_highlighted(self, event: ResultsTable.ResultHighlighted) -> None:
-        stats = self.query_one("#stats-panel", StatsPanel)
+        stats = self._stats_panel
         stats.show_result(event.result)
         if self.show_preview and not self._scan_running:
             self._load_preview(event.result.url)
@@ -830,7 +961,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def on_results_table_context_requested(self, event: ResultsTable.ContextRequested) -> None:
         """Rechtsklick auf Tabellenzeile → Kontextmenue oeffnen."""
-        table = self.query_one("#results-table", ResultsTable)
+        table = self._results_table
         # Filter-Toggle-Label dynamisch: je nach aktuellem Zustand
         # "Nur Fehler anzeigen" oder "Alle anzeigen".
         filter_label = t("ctx.show_all") if table._show_only_errors else t("ctx.show_errors_only")
@@ -881,7 +1012,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             self.push_screen(DietAdvisorScreen(result))
         elif choice == "copy_details":
             # Selected-Result kurz setzen, dann action_copy_details rufen
-            stats = self.query_one("#stats-panel", StatsPanel)
+            stats = self._stats_panel
             stats.show_result(result)
             self.action_copy_details()
         elif choice == "export_jira":
@@ -897,7 +1028,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def _visible_results(self) -> list[ScanResult]:
         """Liefert die aktuell in der Tabelle sichtbaren (gefilterten) Ergebnisse."""
-        return self.query_one("#results-table", ResultsTable).visible_results()
+        return self._results_table.visible_results()
 
     def _export_visible_jira(self) -> None:
         """Kopiert eine JIRA-Tabelle der sichtbaren Fehler-Seiten in die Zwischenablage."""
@@ -1026,7 +1157,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self.whitelist_path = path
         self._settings.whitelist_path = path
         with contextlib.suppress(Exception):
-            self._settings.save()
+            self._save_settings_now()
         return self._whitelist
 
     def _persist_and_reapply_whitelist(self, wl: Whitelist) -> bool:
@@ -1044,13 +1175,13 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             return False
         for r in self._results:
             wl.reclassify(r)
-        table = self.query_one("#results-table", ResultsTable)
+        table = self._results_table
         for r in self._results:
             table.update_result(r)
         with contextlib.suppress(Exception):
-            self.query_one("#stats-panel", StatsPanel).refresh_view()
+            self._stats_panel.refresh_view()
         with contextlib.suppress(Exception):
-            self.query_one("#summary", SummaryHeader).update_from_results(self._results)
+            self._summary_header.update_from_results(self._results)
         return True
 
     @work(exclusive=False, group="rescan")
@@ -1078,7 +1209,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         result.content_type = ""
         result.last_modified = ""
 
-        table = self.query_one("#results-table", ResultsTable)
+        table = self._results_table
         table.update_result(result)
 
         # Single-Result-Scan ueber einen frischen Scanner mit concurrency=1.
@@ -1099,10 +1230,10 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             if self._whitelist is not None:
                 self._whitelist.apply(updated)
             table.update_result(updated)
-            stats = self.query_one("#stats-panel", StatsPanel)
+            stats = self._stats_panel
             if stats.selected_result() is updated:
                 stats.refresh_view()
-            summary = self.query_one("#summary", SummaryHeader)
+            summary = self._summary_header
             summary.update_from_results(self._results)
 
         try:
@@ -1125,7 +1256,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         if not self.show_preview:
             return
         with contextlib.suppress(Exception):
-            table = self.query_one("#results-table", ResultsTable)
+            table = self._results_table
             result = table.get_selected_result()
             if result is not None:
                 self._load_preview(result.url)
@@ -1135,7 +1266,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         """Laedt im Hintergrund einen Screenshot und zeigt ihn im Panel."""
         from .services.preview_service import PreviewService
 
-        panel = self.query_one("#preview-panel", PreviewPanel)
+        panel = self._preview_panel
         panel.show_loading(url)
         if self._preview_service is None:
             self._preview_service = PreviewService(proxy=self.proxy_url)
@@ -1150,7 +1281,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
     def action_toggle_stats_headers(self) -> None:
         """Klick auf den HTTP-Header-Panel-Titel im StatsPanel → ein-/ausklappen."""
         with contextlib.suppress(Exception):
-            self.query_one("#stats-panel", StatsPanel).toggle_headers()
+            self._stats_panel.toggle_headers()
 
     def on_preview_panel_copy_requested(self, event: PreviewPanel.CopyRequested) -> None:
         """Rechtsklick auf das Vorschau-Bild → direkt in Zwischenablage kopieren."""
@@ -1164,7 +1295,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         """Kopiert das aktuelle Vorschau-Bild in die OS-Zwischenablage."""
         from .services.image_clipboard import copy_png_to_clipboard
 
-        panel = self.query_one("#preview-panel", PreviewPanel)
+        panel = self._preview_panel
         png = panel.current_png()
         if png is None:
             self.notify(t("preview.no_image"), severity="warning")
@@ -1178,7 +1309,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def _save_preview_to_disk(self) -> None:
         """Speichert das aktuelle Vorschau-Bild als PNG neben den Reports."""
-        panel = self.query_one("#preview-panel", PreviewPanel)
+        panel = self._preview_panel
         png = panel.current_png()
         url = panel.current_url()
         if png is None or not url:
@@ -1203,6 +1334,8 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         page.goto noch nach dem Browser-Close ein net::ERR_ABORTED
         als unbehandelte Future-Exception.
         """
+        self._flush_log()
+        self._flush_settings_save()
         cancelled_preview = False
         for worker in list(self.workers):
             if getattr(worker, "group", None) == "preview":
@@ -1215,7 +1348,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     # --- Reports / Top 10 / Whitelist Viewer -------------------------------
 
-    def action_save_reports(self) -> None:
+    async def action_save_reports(self) -> None:
         """Speichert HTML- und JSON-Reports."""
         if not self._results:
             self.notify(t("notify.no_results"), severity="warning")
@@ -1226,40 +1359,72 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
             self.notify(t("notify.not_scanned"), severity="warning")
             return
 
-        duration_ms = int((time.monotonic() - self._scan_start_time) * 1000) if self._scan_start_time > 0 else 0
-        summary = ScanSummary.from_results(self.sitemap_url, self._results, duration_ms)
+        duration_ms = int((time.perf_counter() - self._scan_start_time) * 1000) if self._scan_start_time > 0 else 0
+        # Beide Reports und die Zusammenfassung aus demselben Stand - waehrend
+        # geschrieben wird, kann ein neuer Scan oder die Whitelist die Ergebnisse
+        # schon wieder aendern.
+        results = [r.copy() for r in self._results]
+        summary = ScanSummary.from_results(self.sitemap_url, results, duration_ms)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        site_name = _sanitize_filename(urlparse(self.sitemap_url).hostname or "unknown")
-        base_name = f"console-error-report_{site_name}_{timestamp}"
+        base_name = f"console-error-report_{self._sitemap_hostname or 'unknown'}_{timestamp}"
 
         json_path = f"{base_name}.json"
-        saved_json = Reporter.save_json(
-            self._results, summary, json_path, error_weight=self._settings.score_error_weight
-        )
+        saved_json = await self._save_report(Reporter.save_json, results, summary, json_path)
         self._write_log(f"[green]{t('log.json_report', path=self.link_markup(saved_json, saved_json))}[/green]")
 
         html_path = f"{base_name}.html"
-        saved_html = Reporter.save_html(
-            self._results, summary, html_path, error_weight=self._settings.score_error_weight
-        )
+        saved_html = await self._save_report(Reporter.save_html, results, summary, html_path)
         self._write_log(f"[green]{t('log.html_report', path=self.link_markup(saved_html, saved_html))}[/green]")
 
         self.notify(t("notify.reports_saved", json_path=json_path, html_path=html_path))
 
-    def _save_reports_auto(self, summary: ScanSummary) -> None:
-        """Speichert Reports automatisch (CLI-Parameter)."""
+    async def _save_reports_auto(self, summary: ScanSummary) -> None:
+        """Speichert Reports automatisch (CLI-Parameter).
+
+        Args:
+            summary:
+                Zusammenfassung, direkt vorher aus ``self._results`` berechnet.
+        """
+        # Kopie im selben Schritt wie die Zusammenfassung - passt also zu ihr.
+        results = [r.copy() for r in self._results]
         if self.output_json:
-            path = Reporter.save_json(
-                self._results, summary, self.output_json, error_weight=self._settings.score_error_weight
-            )
+            path = await self._save_report(Reporter.save_json, results, summary, self.output_json)
             self._write_log(f"[green]{t('log.json_report', path=self.link_markup(path, path))}[/green]")
         if self.output_html:
-            path = Reporter.save_html(
-                self._results, summary, self.output_html, error_weight=self._settings.score_error_weight
-            )
+            path = await self._save_report(Reporter.save_html, results, summary, self.output_html)
             self._write_log(f"[green]{t('log.html_report', path=self.link_markup(path, path))}[/green]")
 
+    async def _save_report(
+        self,
+        save: Callable[..., str],
+        results: list[ScanResult],
+        summary: ScanSummary,
+        output_path: str,
+    ) -> str:
+        """Schreibt einen Report (Reporter.save_json/save_html) in einem Worker-Thread.
+
+        Serialisieren und Schreiben grosser Reports dauert spuerbar - im Thread
+        bleibt die Oberflaeche bedienbar. Deshalb darf der Thread nur eine Kopie
+        der Ergebnisse (``ScanResult.copy``) sehen: ein Neu-Scan, ein Rescan oder
+        die Whitelist aendern die Live-Objekte, waehrend er noch schreibt.
+
+        Args:
+            save:
+                Reporter.save_json oder Reporter.save_html.
+            results:
+                Kopie der Ergebnisse, auf dem Event-Loop erstellt.
+            summary:
+                Gesamtzusammenfassung fuer den Report (aus derselben Kopie).
+            output_path:
+                Zielpfad der Datei.
+
+        Returns:
+            Absoluter Pfad der gespeicherten Datei.
+        """
+        error_weight = self._settings.score_error_weight
+        return await asyncio.to_thread(save, results, summary, output_path, error_weight=error_weight)
+
     def action_export_jira(self) -> None:
         """Kopiert eine JIRA-Tabelle der Fehler-Seiten in die Zwischenablage.
 
@@ -1283,7 +1448,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def action_copy_details(self) -> None:
         """Kopiert die Detail-Ansicht (rechter Bereich) in die Zwischenablage."""
-        stats = self.query_one("#stats-panel", StatsPanel)
+        stats = self._stats_panel
         result = stats.selected_result()
         if result is None:
             self.notify(t("notify.no_url_selected"), severity="warning")
@@ -1346,29 +1511,24 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
     def action_toggle_log(self) -> None:
         """Blendet das LogPanel (samt Splitter) ein/aus."""
-        log_panel = self.query_one("#scan-log", LogPanel)
+        log_panel = self._scan_log
         log_panel.toggle()
-        self.query_one("#log-splitter", HorizontalSplitter).set_class(log_panel.has_class("-log-hidden"), "hidden")
+        self._log_splitter.set_class(log_panel.has_class("-log-hidden"), "hidden")
 
     def on_log_panel_hidden(self, event: LogPanel.Hidden) -> None:
         """Log per Kontextmenue ausgeblendet — Splitter mit ausblenden."""
-        self.query_one("#log-splitter", HorizontalSplitter).add_class("hidden")
+        self._log_splitter.add_class("hidden")
 
     def action_toggle_errors(self) -> None:
         """Wechselt zwischen alle/nur Fehler in der Tabelle."""
         if not self._results:
             self.notify(t("notify.no_results"), severity="warning")
             return
-        table = self.query_one("#results-table", ResultsTable)
+        table = self._results_table
         active = table.toggle_error_filter()
 
         new_label = t("binding.errors_show_all") if active else t("binding.errors_only")
-        for i, b in enumerate(self._bindings.key_to_bindings.get("e", [])):
-            if b.action == "toggle_errors":
-                self._bindings.key_to_bindings["e"][i] = dataclasses.replace(b, description=new_label)
-        for i, b in enumerate(self._bindings.key_to_bindings.get("E", [])):
-            if b.action == "toggle_errors":
-                self._bindings.key_to_bindings["E"][i] = dataclasses.replace(b, description=new_label)
+        self._set_binding_description("toggle_errors", new_label)
         self.refresh_bindings()
 
     def action_focus_filter(self) -> None:
@@ -1495,7 +1655,7 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         )
         self._settings.proxy_url = str(result.get("proxy_url", self._settings.proxy_url))
         self._settings.jira_format = str(result.get("jira_format", self._settings.jira_format))
-        self._settings.save()
+        self._save_settings_now()
 
         # Runtime-Werte fuer den naechsten Scan aktualisieren
         self.accept_consent = self._settings.accept_consent
@@ -1513,11 +1673,11 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         self.proxy_url = self._settings.proxy_url
         # Tabelle sofort neu einfaerben (kein Neu-Scan noetig).
         with contextlib.suppress(Exception):
-            self.query_one("#results-table", ResultsTable).set_size_warn_mb(self.size_warn_mb)
+            self._results_table.set_size_warn_mb(self.size_warn_mb)
 
         # Preview-Panel zur Laufzeit ein-/ausblenden
         with contextlib.suppress(Exception):
-            self.query_one("#preview-panel", PreviewPanel).display = self.show_preview
+            self._preview_panel.display = self.show_preview
             self.query_one("#preview-splitter", HorizontalSplitter).display = self.show_preview
             if self.show_preview:
                 self._refresh_preview_for_cursor()
@@ -1569,14 +1729,14 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
 
             # Tabelle + Detail + Summary neu zeichnen
             with contextlib.suppress(Exception):
-                table = self.query_one("#results-table", ResultsTable)
+                table = self._results_table
                 table.load_results(self._results)
             with contextlib.suppress(Exception):
-                self.query_one("#stats-panel", StatsPanel).refresh_view()
+                self._stats_panel.refresh_view()
 
         # Header mit aktuellen Konfig-Werten aktualisieren
         with contextlib.suppress(Exception):
-            header = self.query_one("#summary", SummaryHeader)
+            header = self._summary_header
             header.update_config(
                 self.concurrency,
                 self.timeout,
@@ -1635,7 +1795,42 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         if self._settings.theme == theme_name:
             return
         self._settings.theme = theme_name
-        self._settings.save()
+        # Durchklicken der Themes soll nicht bei jedem Schritt auf die Platte.
+        self._schedule_settings_save()
+
+    def _schedule_settings_save(self) -> None:
+        """Merkt eine Settings-Speicherung vor (einmal pro _SETTINGS_SAVE_DELAY).
+
+        Ohne laufende App (kein Timer moeglich) wird sofort gespeichert.
+        """
+        if self._settings_save_timer is not None:
+            return
+        try:
+            self._settings_save_timer = self.set_timer(_SETTINGS_SAVE_DELAY, self._save_settings_in_background)
+        except Exception:
+            self._save_settings_now()
+
+    def _save_settings_in_background(self) -> None:
+        """Timer-Callback: schreibt die Settings in einem Worker-Thread."""
+        self._settings_save_timer = None
+        self.run_worker(self._save_settings_now, thread=True, group="settings-save")
+
+    def _save_settings_now(self) -> None:
+        """Schreibt die Settings sofort (auch aus einem Worker-Thread aufrufbar)."""
+        with self._settings_lock:
+            self._settings.save()
+
+    def _flush_settings_save(self) -> None:
+        """Speichert eine noch vorgemerkte Aenderung sofort (beim Beenden)."""
+        if self._settings_save_timer is None:
+            # Ein Worker-Thread kann gerade noch schreiben - abwarten, bevor der
+            # Prozess endet.
+            with self._settings_lock:
+                pass
+            return
+        self._settings_save_timer.stop()
+        self._settings_save_timer = None
+        self._save_settings_now()
 
     # --- check_action -------------------------------------------------------
 
@@ -1698,21 +1893,56 @@ class ConsoleErrorScannerApp(CrashGuard, ClickableLinksMixin, LogRouter, App):
         sekundenlang weiter - und lassen den Abbruch wirkungslos aussehen. Die
         Zeilen auf der ersten Ebene (Ergebnis je Seite, Abschluss) bleiben.
         """
+        if threading.get_ident() != self._ui_thread_id:
+            # Aus einem Worker-Thread (z.B. thread=True-Worker): an die
+            # Event-Loop uebergeben. Im Normalfall kostet das nur den Vergleich.
+            self.call_from_thread(self._write_log, line)
+            return
         if self._scan_cancelled and line.startswith(" "):
             return
-        with contextlib.suppress(Exception):
-            self.query_one("#scan-log", LogPanel).write_log(self.linkify_urls(line))
+        # Gepuffert: waehrend eines Scans kommen Dutzende Zeilen pro Sekunde,
+        # das LogPanel bekommt sie gesammelt in einem Aufruf (_flush_log).
+        self._log_buffer.append(line)
+        if self._log_flush_timer is None:
+            with contextlib.suppress(Exception):
+                self._log_flush_timer = self.set_timer(_UI_FLUSH_INTERVAL, self._flush_log)
+
+    def _flush_log(self) -> None:
+        """Schreibt alle gepufferten Log-Zeilen in einem Rutsch ins LogPanel."""
+        if self._log_flush_timer is not None:
+            self._log_flush_timer.stop()
+            self._log_flush_timer = None
+        if not self._log_buffer:
+            return
+        lines = [self.linkify_urls(line) for line in self._log_buffer]
+        self._log_buffer.clear()
+        try:
+            self._scan_log.write_log("\n".join(lines))
+        except Exception:
+            # Eine Zeile mit kaputtem Markup darf nicht den ganzen Block
+            # mitnehmen - einzeln geschrieben geht nur sie verloren.
+            for line in lines:
+                with contextlib.suppress(Exception):
+                    self._scan_log.write_log(line)
 
 
 _BAR_WIDTH = 20
 
+# Alle moeglichen Fortschrittsbalken, Index = Anzahl gefuellter Zeichen.
+_BARS = tuple("█" * filled + "░" * (_BAR_WIDTH - filled) for filled in range(_BAR_WIDTH + 1))
+
+# Hoechstens so oft (Sekunden) zieht die Anzeige waehrend eines Scans nach.
+_UI_FLUSH_INTERVAL = 0.05
+
+# Verzoegerung (Sekunden), mit der beilaeufige Settings-Aenderungen gespeichert werden.
+_SETTINGS_SAVE_DELAY = 2.0
+
 
 def _format_progress_bar(current: int, total: int) -> str:
     """Erzeugt einen Unicode-Fortschrittsbalken."""
     if total <= 0:
-        return "░" * _BAR_WIDTH
-    filled = int(_BAR_WIDTH * current / total)
-    return "█" * filled + "░" * (_BAR_WIDTH - filled)
+        return _BARS[0]
+    return _BARS[min(_BAR_WIDTH, _BAR_WIDTH * current // total)]
 
 
 def _format_duration(duration_ms: int) -> str:
@@ -1720,12 +1950,10 @@ def _format_duration(duration_ms: int) -> str:
     total_s = duration_ms / 1000
     if total_s < 60:
         return f"{total_s:.1f}s"
-    minutes = int(total_s // 60)
-    seconds = int(total_s % 60)
+    minutes, seconds = divmod(duration_ms // 1000, 60)
     if minutes < 60:
         return f"{minutes}m {seconds}s"
-    hours = minutes // 60
-    minutes = minutes % 60
+    hours, minutes = divmod(minutes, 60)
     return f"{hours}h {minutes}m {seconds}s"
 
 
@@ -1741,9 +1969,13 @@ def _fmt_setting(value: object) -> str:
     return text
 
 
+# In Dateinamen unzulaessige Zeichen -> "_" (einmal gebaut, str.translate).
+_FILENAME_TABLE = str.maketrans(dict.fromkeys('/:*?"<>|\\', "_"))
+
+
 def _sanitize_filename(name: str) -> str:
     """Bereinigt einen String fuer Dateinamen."""
-    return re.sub(r'[/:*?"<>|\\]', "_", name).strip("_.")
+    return name.translate(_FILENAME_TABLE).strip("_.")
 
 
 class _SitemapErrorScreen(ModalScreen):
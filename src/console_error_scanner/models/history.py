@@ -6,10 +6,12 @@ Speichert und laedt vergangene Scan-Konfigurationen aus
 
 from __future__ import annotations
 
+import functools
 import getpass
 import json
 import logging
-from dataclasses import dataclass, field
+import os
+from dataclasses import MISSING, asdict, dataclass, field, fields
 from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
@@ -17,7 +19,36 @@ from urllib.parse import urlparse
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@functools.lru_cache(maxsize=128)
+def _display_host(sitemap_url: str) -> str:
+    """Hostname fuer die History-Liste (gecacht - die Liste zeigt dieselben URLs immer wieder).
+
+    Args:
+        sitemap_url: URL der Sitemap.
+
+    Returns:
+        Hostname oder die URL selbst, wenn keiner ermittelt werden kann.
+    """
+    try:
+        return urlparse(sitemap_url).hostname or sitemap_url
+    except Exception:
+        return sitemap_url
+
+
+@functools.lru_cache(maxsize=128)
+def _display_timestamp(timestamp: str) -> str:
+    """Kurzform "YYYY-MM-DD HH:MM" eines ISO-Zeitstempels (gecacht wie der Host).
+
+    Args:
+        timestamp: Zeitstempel im ISO-Format.
+
+    Returns:
+        Gekuerzter Zeitstempel oder "?" wenn keiner gesetzt ist.
+    """
+    return timestamp[:16].replace("T", " ") if timestamp else "?"
+
+
+@dataclass(slots=True)
 class HistoryEntry:
     """Einzelner Eintrag in der Scan-History.
 
@@ -58,45 +89,37 @@ class HistoryEntry:
         Returns:
             Dictionary mit allen Feldern.
         """
-        return {
-            "sitemap_url": self.sitemap_url,
-            "timestamp": self.timestamp,
-            "user": self.user,
-            "concurrency": self.concurrency,
-            "timeout": self.timeout,
-            "console_level": self.console_level,
-            "url_filter": self.url_filter,
-            "user_agent": self.user_agent,
-            "cookies": self.cookies,
-            "whitelist_path": self.whitelist_path,
-            "accept_consent": self.accept_consent,
-            "trigger_lazy_load": self.trigger_lazy_load,
-        }
+        return asdict(self)
+
+    @property
+    def display_host(self) -> str:
+        """Hostname der Sitemap fuer die Anzeige (Fallback: die URL selbst)."""
+        return _display_host(self.sitemap_url)
+
+    @property
+    def display_timestamp(self) -> str:
+        """Zeitstempel fuer die Anzeige: nur YYYY-MM-DD HH:MM."""
+        return _display_timestamp(self.timestamp)
 
     @staticmethod
     def from_dict(data: dict) -> HistoryEntry:
         """Erstellt einen HistoryEntry aus einem Dictionary.
 
+        Fehlende Felder bekommen ihren Default aus der Dataclass-Definition.
+
         Args:
             data: Dictionary mit den Feldern des Eintrags.
 
         Returns:
             Neuer HistoryEntry.
         """
-        return HistoryEntry(
-            sitemap_url=data.get("sitemap_url", ""),
-            timestamp=data.get("timestamp", ""),
-            user=data.get("user", ""),
-            concurrency=data.get("concurrency", 8),
-            timeout=data.get("timeout", 60),
-            console_level=data.get("console_level", "warn"),
-            url_filter=data.get("url_filter", ""),
-            user_agent=data.get("user_agent", ""),
-            cookies=data.get("cookies", []),
-            whitelist_path=data.get("whitelist_path", ""),
-            accept_consent=data.get("accept_consent", True),
-            trigger_lazy_load=data.get("trigger_lazy_load", True),
-        )
+        kwargs = {}
+        for name, default, factory in _ENTRY_FIELDS:
+            if name in data:
+                kwargs[name] = data[name]
+            else:
+                kwargs[name] = default if factory is MISSING else factory()
+        return HistoryEntry(**kwargs)
 
     def display_label(self) -> str:
         """Erzeugt ein kompaktes Label fuer die Anzeige in der History-Liste.
@@ -106,37 +129,26 @@ class HistoryEntry:
         Returns:
             Kurzform-String fuer die Listenanzeige.
         """
-        # Datum kuerzen: nur YYYY-MM-DD HH:MM
-        date_part = self.timestamp[:16].replace("T", " ") if self.timestamp else "?"
-
-        # Hostname extrahieren
-        try:
-            host = urlparse(self.sitemap_url).hostname or self.sitemap_url
-        except Exception:
-            host = self.sitemap_url
-
-        parts = [date_part, host]
-
-        if self.cookies:
-            cookie_names = ", ".join(c.get("name", "?") for c in self.cookies)
-            parts.append(f"--cookie {cookie_names}")
-
-        if self.whitelist_path:
-            parts.append(f"--whitelist {self.whitelist_path}")
-
-        if self.url_filter:
-            parts.append(f"--filter {self.url_filter}")
-
-        if self.user_agent:
-            parts.append("--user-agent ...")
+        cookie_names = ", ".join(c.get("name", "?") for c in self.cookies)
+        options = (
+            (self.cookies, f"--cookie {cookie_names}"),
+            (self.whitelist_path, f"--whitelist {self.whitelist_path}"),
+            (self.url_filter, f"--filter {self.url_filter}"),
+            (self.user_agent, "--user-agent ..."),
+            (not self.accept_consent, "--no-consent"),
+            (not self.trigger_lazy_load, "--no-scroll"),
+        )
+        parts = [self.display_timestamp, self.display_host]
+        parts.extend(text for active, text in options if active)
 
-        if not self.accept_consent:
-            parts.append("--no-consent")
+        return " | ".join(parts)
 
-        if not self.trigger_lazy_load:
-            parts.append("--no-scroll")
 
-        return " | ".join(parts)
+# (Name, Default, Default-Factory) je Init-Feld - einmal ermittelt fuer
+# from_dict. Pflichtfelder ohne Default (sitemap_url) bekommen "".
+_ENTRY_FIELDS = tuple(
+    (f.name, "" if f.default is MISSING else f.default, f.default_factory) for f in fields(HistoryEntry) if f.init
+)
 
 
 class History:
@@ -150,24 +162,50 @@ class History:
     HISTORY_FILE = HISTORY_DIR / "history.json"
     MAX_ENTRIES = 50
 
+    # Zuletzt gelesene/geschriebene Eintraege und der Dateistand, zu dem sie
+    # gehoeren (Pfad, mtime, Groesse). Solange sich die Datei nicht aendert,
+    # muss sie nicht erneut geparst werden.
+    _cache: list[HistoryEntry] | None = None
+    _cache_key: tuple[str, int, int] | None = None
+
+    @staticmethod
+    def _file_key() -> tuple[str, int, int] | None:
+        """Liefert den aktuellen Dateistand oder None, wenn die Datei fehlt."""
+        # Pfad einmal als String: os.stat darauf spart den Umweg ueber Path.stat,
+        # und derselbe String dient als Teil des Cache-Schluessels.
+        path = os.fspath(History.HISTORY_FILE)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (path, stat.st_mtime_ns, stat.st_size)
+
     @staticmethod
     def load() -> list[HistoryEntry]:
         """Laedt die History aus der JSON-Datei.
 
-        Gibt eine leere Liste zurueck bei Fehler oder fehlender Datei.
+        Gibt eine leere Liste zurueck bei Fehler oder fehlender Datei. Ist die
+        Datei seit dem letzten Laden/Speichern unveraendert, kommt eine Kopie
+        der zwischengespeicherten Liste zurueck.
 
         Returns:
             Liste der HistoryEntry-Objekte (neueste zuerst).
         """
-        if not History.HISTORY_FILE.is_file():
+        key = History._file_key()
+        if key is None:
             return []
+        if key == History._cache_key and History._cache is not None:
+            return list(History._cache)
 
         try:
-            raw = History.HISTORY_FILE.read_text(encoding="utf-8")
-            data = json.loads(raw)
+            # json.loads erkennt UTF-8 in Bytes selbst - spart das separate Dekodieren.
+            data = json.loads(History.HISTORY_FILE.read_bytes())
             if not isinstance(data, list):
                 return []
-            return [HistoryEntry.from_dict(item) for item in data]
+            entries = [HistoryEntry.from_dict(item) for item in data]
+            History._cache = entries
+            History._cache_key = key
+            return list(entries)
         except Exception as exc:
             logger.warning("History konnte nicht geladen werden: %s", exc)
             return []
@@ -176,7 +214,9 @@ class History:
     def save(entries: list[HistoryEntry]) -> None:
         """Speichert die History in die JSON-Datei.
 
-        Erstellt das Verzeichnis falls es nicht existiert.
+        Erstellt das Verzeichnis falls es nicht existiert. Geschrieben wird
+        erst in eine temporaere Datei, die dann die alte ersetzt - ein Absturz
+        mitten im Schreiben hinterlaesst so keine halbe history.json.
 
         Args:
             entries: Liste der HistoryEntry-Objekte.
@@ -184,10 +224,11 @@ class History:
         try:
             History.HISTORY_DIR.mkdir(parents=True, exist_ok=True)
             data = [entry.to_dict() for entry in entries]
-            History.HISTORY_FILE.write_text(
-                json.dumps(data, indent=2, ensure_ascii=False),
-                encoding="utf-8",
-            )
+            tmp_file = History.HISTORY_FILE.with_name(History.HISTORY_FILE.name + ".tmp")
+            tmp_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_file, History.HISTORY_FILE)
+            History._cache = list(entries)
+            History._cache_key = History._file_key()
         except Exception as exc:
             logger.warning("History konnte nicht gespeichert werden: %s", exc)
 
@@ -203,7 +244,7 @@ class History:
         """
         # Timestamp und User setzen falls nicht vorhanden
         if not entry.timestamp:
-            entry.timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+            entry.timestamp = datetime.now().isoformat(timespec="seconds")
         if not entry.user:
             try:
                 entry.user = getpass.getuser()
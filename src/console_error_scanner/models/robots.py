@@ -80,9 +80,7 @@ class RobotsChecker:
                 if response.status_code == 200:
                     self._parse(response.text)
             else:
-                jar = httpx.Cookies()
-                for cookie in cookies or []:
-                    jar.set(cookie["name"], cookie["value"])
+                jar = httpx.Cookies({cookie["name"]: cookie["value"] for cookie in cookies or []})
                 async with httpx.AsyncClient(
                     timeout=10.0,
                     follow_redirects=True,
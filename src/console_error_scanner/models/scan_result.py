@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields, replace
 from enum import Enum
+from typing import ClassVar, NamedTuple
 
 
 class ErrorType(Enum):
@@ -27,7 +28,13 @@ class PageStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+# Status, die im Header als "gescannt" zaehlen (auch Timeouts - die Seite
+# wurde versucht). Tupel statt frozenset aus demselben Grund wie bei
+# ScanResult._ERROR_TYPES: Identitaetsvergleich statt Enum-Hash.
+_SCANNED_STATUSES = (PageStatus.OK, PageStatus.WARNING, PageStatus.ERROR, PageStatus.TIMEOUT)
+
+
+@dataclass(slots=True)
 class PageError:
     """Ein einzelner Fehler auf einer Seite."""
 
@@ -40,7 +47,9 @@ class PageError:
     def to_dict(self) -> dict:
         """Konvertiert den Fehler in ein Dictionary."""
         return {
-            "error_type": self.error_type.value,
+            # ``_value_`` ist das Instanzattribut hinter der Python-Property
+            # ``.value`` - direkt gelesen spart das je Fehler einen Aufruf.
+            "error_type": self.error_type._value_,
             "message": self.message,
             "source": self.source,
             "line_number": self.line_number,
@@ -48,7 +57,7 @@ class PageError:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceSize:
     """Eine einzelne geladene Ressource mit ihrer Transfergroesse.
 
@@ -68,7 +77,26 @@ class ResourceSize:
         }
 
 
-@dataclass
+class ResultCounts(NamedTuple):
+    """Beitrag EINER Seite zu den Zaehlern im Summary-Header.
+
+    Die Felder heissen wie die Header-Eintraege. Summen ueber alle Seiten
+    lassen sich so inkrementell nachfuehren: alten Beitrag abziehen, neuen
+    addieren (siehe SummaryHeader.update_results).
+    """
+
+    scanned: int = 0
+    with_errors: int = 0
+    console_err: int = 0
+    console_warn: int = 0
+    ignored: int = 0
+    http_404: int = 0
+    http_4xx: int = 0
+    http_5xx: int = 0
+    timeouts: int = 0
+
+
+@dataclass(slots=True)
 class ScanResult:
     """Ergebnis des Scans einer einzelnen Seite."""
 
@@ -117,8 +145,15 @@ class ScanResult:
         """Anzahl der HTTP 5xx Fehler (ohne whitelisted)."""
         return sum(1 for e in self.errors if e.error_type == ErrorType.HTTP_5XX and not e.whitelisted)
 
-    # Fehlertypen die als "echter Fehler" (ERR) zaehlen
-    _ERROR_TYPES = {ErrorType.CONSOLE_ERROR, ErrorType.HTTP_404, ErrorType.HTTP_4XX, ErrorType.HTTP_5XX}
+    # Fehlertypen die als "echter Fehler" (ERR) zaehlen. Bewusst ein Tupel:
+    # ``in`` prueft dort zuerst die Identitaet, ein Set muesste jedes Mal den
+    # (in Python implementierten) Enum-Hash berechnen.
+    _ERROR_TYPES: ClassVar[tuple[ErrorType, ...]] = (
+        ErrorType.CONSOLE_ERROR,
+        ErrorType.HTTP_404,
+        ErrorType.HTTP_4XX,
+        ErrorType.HTTP_5XX,
+    )
 
     @property
     def has_errors(self) -> bool:
@@ -155,6 +190,46 @@ class ScanResult:
         }
         return icons.get(self.status, "?")
 
+    def reset(self) -> None:
+        """Setzt alle Scan-Daten zurueck - danach wie ``ScanResult(url=self.url)``."""
+        for name, default, factory in _RESET_FIELDS:
+            setattr(self, name, default if factory is MISSING else factory())
+
+    def copy(self) -> ScanResult:
+        """Liefert eine unabhaengige Kopie fuer Auswertungen ausserhalb des Event-Loops.
+
+        Fehler, Header und Ressourcen werden mitkopiert: ein Neu-Scan tauscht die
+        Listen aus, die Whitelist setzt ``whitelisted`` direkt am Fehler um.
+        """
+        return replace(
+            self,
+            errors=[replace(e) for e in self.errors],
+            response_headers=dict(self.response_headers),
+            resource_sizes=list(self.resource_sizes),
+        )
+
+    def snapshot(self) -> ResultCounts:
+        """Zaehlt alle Header-relevanten Werte in einem Durchlauf ueber die Fehler."""
+        counts = dict.fromkeys(ErrorType, 0)
+        ignored = 0
+        for e in self.errors:
+            if e.whitelisted:
+                ignored += 1
+            else:
+                counts[e.error_type] += 1
+        status = self.status
+        return ResultCounts(
+            scanned=int(status in _SCANNED_STATUSES),
+            with_errors=int(any(counts[error_type] for error_type in self._ERROR_TYPES)),
+            console_err=counts[ErrorType.CONSOLE_ERROR],
+            console_warn=counts[ErrorType.CONSOLE_WARNING],
+            ignored=ignored,
+            http_404=counts[ErrorType.HTTP_404],
+            http_4xx=counts[ErrorType.HTTP_4XX],
+            http_5xx=counts[ErrorType.HTTP_5XX],
+            timeouts=int(status is PageStatus.TIMEOUT),
+        )
+
     @property
     def total_error_count(self) -> int:
         """Gesamtanzahl aller nicht-whitelisted Fehler."""
@@ -162,30 +237,39 @@ class ScanResult:
 
     def to_dict(self) -> dict:
         """Konvertiert das Ergebnis in ein Dictionary."""
-        active_errors = [e for e in self.errors if not e.whitelisted]
-        ignored_errors = [e for e in self.errors if e.whitelisted]
+        # Zaehler aus einem Durchlauf (snapshot) statt je Property einem.
+        counts = self.snapshot()
+        # Aufteilen und Serialisieren im selben Durchlauf - ohne Zwischenlisten.
+        active_errors: list[dict] = []
+        ignored_errors: list[dict] = []
+        for e in self.errors:
+            (ignored_errors if e.whitelisted else active_errors).append(e.to_dict())
         return {
             "url": self.url,
-            "status": self.status.value,
+            "status": self.status._value_,
             "http_status_code": self.http_status_code,
             "load_time_ms": self.load_time_ms,
             "dom_content_loaded_ms": self.dom_content_loaded_ms,
             "request_count": self.request_count,
             "page_size_bytes": self.page_size_bytes,
-            "total_errors": self.total_error_count,
-            "console_errors": self.console_error_count,
-            "console_warnings": self.console_warning_count,
-            "http_404_errors": self.http_404_count,
-            "http_4xx_errors": self.http_4xx_count,
-            "http_5xx_errors": self.http_5xx_count,
-            "ignored_count": self.ignored_count,
+            "total_errors": len(active_errors),
+            "console_errors": counts.console_err,
+            "console_warnings": counts.console_warn,
+            "http_404_errors": counts.http_404,
+            "http_4xx_errors": counts.http_4xx,
+            "http_5xx_errors": counts.http_5xx,
+            "ignored_count": counts.ignored,
             "retry_count": self.retry_count,
-            "errors": [e.to_dict() for e in active_errors],
-            "ignored_errors": [e.to_dict() for e in ignored_errors],
+            "errors": active_errors,
+            "ignored_errors": ignored_errors,
         }
 
 
-@dataclass
+# (Name, Default, Default-Factory) aller Felder ausser der URL - fuer reset().
+_RESET_FIELDS = tuple((f.name, f.default, f.default_factory) for f in fields(ScanResult) if f.name != "url")
+
+
+@dataclass(slots=True)
 class ScanSummary:
     """Gesamtzusammenfassung eines Scans."""
 
@@ -205,25 +289,37 @@ class ScanSummary:
     @staticmethod
     def from_results(sitemap_url: str, results: list[ScanResult], duration_ms: int = 0) -> ScanSummary:
         """Erstellt eine Zusammenfassung aus den Scan-Ergebnissen."""
-        summary = ScanSummary(sitemap_url=sitemap_url)
-        summary.total_urls = len(results)
-        summary.scan_duration_ms = duration_ms
-
+        # Ein Durchlauf ueber die Fehler je Seite (snapshot) statt einem pro Zaehler;
+        # summiert wird in lokalen Variablen, die Summary entsteht erst am Ende.
+        scanned = with_errors = console_err = console_warn = ignored = 0
+        http_404 = http_4xx = http_5xx = timeouts = 0
         for result in results:
-            if result.status in (PageStatus.OK, PageStatus.WARNING, PageStatus.ERROR):
-                summary.scanned_urls += 1
-            if result.has_errors:
-                summary.urls_with_errors += 1
-            if result.status == PageStatus.TIMEOUT:
-                summary.total_timeouts += 1
-            summary.total_console_errors += result.console_error_count
-            summary.total_console_warnings += result.console_warning_count
-            summary.total_http_404 += result.http_404_count
-            summary.total_http_4xx += result.http_4xx_count
-            summary.total_http_5xx += result.http_5xx_count
-            summary.total_ignored += result.ignored_count
-
-        return summary
+            s, we, ce, cw, ig, h404, h4xx, h5xx, to = result.snapshot()
+            scanned += s
+            with_errors += we
+            console_err += ce
+            console_warn += cw
+            ignored += ig
+            http_404 += h404
+            http_4xx += h4xx
+            http_5xx += h5xx
+            timeouts += to
+
+        return ScanSummary(
+            sitemap_url=sitemap_url,
+            total_urls=len(results),
+            # Timeouts zaehlen im Header als gescannt, in der Zusammenfassung nicht.
+            scanned_urls=scanned - timeouts,
+            urls_with_errors=with_errors,
+            total_console_errors=console_err,
+            total_console_warnings=console_warn,
+            total_http_404=http_404,
+            total_http_4xx=http_4xx,
+            total_http_5xx=http_5xx,
+            total_timeouts=timeouts,
+            total_ignored=ignored,
+            scan_duration_ms=duration_ms,
+        )
 
     def to_dict(self) -> dict:
         """Konvertiert die Zusammenfassung in ein Dictionary."""
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import ClassVar
 
 from ..i18n import detect_language
 
@@ -59,7 +61,7 @@ SETTINGS_FILE = SETTINGS_DIR / "settings.json"
 CRASH_LOG_NAME = "last-crash.txt"
 
 
-@dataclass
+@dataclass(slots=True)
 class Settings:
     """Persistierte Benutzereinstellungen.
 
@@ -116,8 +118,8 @@ class Settings:
     # JIRA-Exportformat: "markdown" (Jira Cloud) oder "wiki" (Server/DC).
     jira_format: str = "markdown"
 
-    SETTINGS_DIR = SETTINGS_DIR
-    SETTINGS_FILE = SETTINGS_FILE
+    SETTINGS_DIR: ClassVar[Path] = SETTINGS_DIR
+    SETTINGS_FILE: ClassVar[Path] = SETTINGS_FILE
 
     def to_dict(self) -> dict:
         """Konvertiert die Einstellungen in ein Dictionary fuer JSON."""
@@ -151,11 +153,16 @@ class Settings:
         Migriert dabei alte Theme-Slugs aus textual-themes < 0.5 auf
         ihre aktuellen Namen und persistiert die Migration.
         """
-        if not SETTINGS_FILE.is_file():
+        try:
+            # Direkt lesen statt vorher is_file() zu fragen - ein Syscall weniger.
+            raw = SETTINGS_FILE.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return Settings()
+        except Exception as exc:
+            logger.warning("Settings konnten nicht geladen werden: %s", exc)
             return Settings()
 
         try:
-            raw = SETTINGS_FILE.read_text(encoding="utf-8")
             data = json.loads(raw)
             if not isinstance(data, dict):
                 return Settings()
@@ -195,10 +202,15 @@ class Settings:
         """Speichert die Einstellungen in die JSON-Datei."""
         try:
             SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
-            SETTINGS_FILE.write_text(
+            # Erst komplett in eine Temp-Datei, dann atomar ersetzen: endet der
+            # Prozess mitten im Schreiben (verzoegertes Speichern im Worker-Thread),
+            # bleibt die alte settings.json heil statt abgeschnitten.
+            tmp_file = SETTINGS_FILE.with_name(SETTINGS_FILE.name + ".tmp")
+            tmp_file.write_text(
                 json.dumps(self.to_dict(), indent=2, ensure_ascii=False),
                 encoding="utf-8",
             )
+            os.replace(tmp_file, SETTINGS_FILE)
         except Exception as exc:
             logger.warning("Settings konnten nicht gespeichert werden: %s", exc)
 
@@ -215,18 +227,13 @@ def parse_cookies(raw: str) -> list[dict[str, str]]:
     """
     if not raw or not raw.strip():
         return []
-    parts: list[str] = []
-    for chunk in raw.split(";"):
-        parts.extend(p.strip() for p in chunk.split(",") if p.strip())
     cookies: list[dict[str, str]] = []
-    for entry in parts:
-        if "=" not in entry:
-            continue
-        name, value = entry.split("=", 1)
-        name = name.strip()
-        value = value.strip()
-        if name:
-            cookies.append({"name": name, "value": value})
+    for chunk in raw.split(";"):
+        for entry in chunk.split(","):
+            name, sep, value = entry.partition("=")
+            name = name.strip()
+            if sep and name:
+                cookies.append({"name": name, "value": value.strip()})
     return cookies
 
 
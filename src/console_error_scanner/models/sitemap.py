@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from urllib.parse import urlparse, urlunparse
@@ -12,6 +15,28 @@ from ..i18n import t
 
 # Standard-Namespace fuer Sitemaps
 SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_NS_SITEMAP = f"{{{SITEMAP_NS}}}sitemap"
+_NS_URL = f"{{{SITEMAP_NS}}}url"
+_NS_LOC = f"{{{SITEMAP_NS}}}loc"
+
+# Versuche beim Laden der Sitemap per HTTP (mit Backoff dazwischen).
+_FETCH_RETRIES = 3
+
+# Zeichen pro Happen beim Streaming-Parse (siehe SitemapParser._parse_xml).
+_PARSE_CHUNK = 64 * 1024
+
+# "Sitemap:"-Zeilen in robots.txt (Gross-/Kleinschreibung egal) in einem
+# Regex-Durchlauf. Zeilenende ist "\n", "\r\n" ODER ein einzelnes "\r" (RFC 9309)
+# - re.MULTILINE kennt nur "\n", daher die Lookarounds statt ^/$. Nur
+# horizontaler Whitespace nach dem Doppelpunkt, damit eine leere
+# "Sitemap:"-Zeile nicht die naechste Zeile als URL einfaengt.
+_ROBOTS_SITEMAP_RE = re.compile(
+    r"(?:^|(?<=[\r\n]))[^\S\r\n]*sitemap:[^\S\r\n]*(\S[^\r\n]*?)[^\S\r\n]*(?=[\r\n]|\Z)",
+    re.IGNORECASE,
+)
+
+# Encoding aus der XML-Deklaration (nur am Dokumentanfang gesucht).
+_XML_ENCODING_RE = re.compile(rb"""^\s*<\?xml[^>]*?\bencoding\s*=\s*["']([A-Za-z0-9._-]+)["']""")
 
 # Typische Sitemap-Pfade fuer Auto-Discovery (in Prioritaetsreihenfolge)
 _COMMON_SITEMAP_PATHS = [
@@ -32,8 +57,8 @@ def is_sitemap_url(url: str) -> bool:
     Returns:
         True wenn die URL auf .xml endet (= direkte Sitemap-URL).
     """
-    path = urlparse(url).path.lower()
-    return path.endswith(".xml")
+    # Nur die Endung zaehlt - den ganzen Pfad klein zu schreiben waere unnoetig.
+    return urlparse(url).path[-4:].lower() == ".xml"
 
 
 def is_local_file(path: str) -> bool:
@@ -45,7 +70,8 @@ def is_local_file(path: str) -> bool:
     Returns:
         True wenn es ein existierender lokaler Dateipfad ist.
     """
-    if path.lower().startswith(("http://", "https://")):
+    # Das Schema steckt in den ersten 8 Zeichen ("https://").
+    if path[:8].lower().startswith(("http://", "https://")):
         return False
     return Path(path).is_file()
 
@@ -59,11 +85,15 @@ class SitemapParser:
         url_filter: str = "",
         cookies: list[dict[str, str]] | None = None,
         proxy: str = "",
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self.sitemap_url = sitemap_url
         self.url_filter = url_filter
         self.cookies = cookies or []
         self.proxy = proxy.strip()
+        # Optionaler, vom Aufrufer verwalteter Client (Verbindungen wiederverwenden,
+        # Tests ohne Netzwerk) - sonst oeffnet _fetch_sitemap einen eigenen.
+        self._client = client
 
     async def parse(self) -> list[str]:
         """Laedt die Sitemap und gibt die enthaltenen URLs zurueck.
@@ -83,11 +113,17 @@ class SitemapParser:
 
         return urls
 
-    async def _fetch_sitemap(self) -> str:
+    async def _fetch_sitemap(self) -> str | bytes:
         """Laedt die Sitemap per HTTP oder aus lokaler Datei.
 
+        Per HTTP kommen wenn moeglich die rohen Bytes zurueck: der XML-Parser
+        liest das Encoding selbst aus der Deklaration, ein vorheriges Dekodieren
+        der ganzen Antwort in einen String waere nur eine zusaetzliche Kopie.
+        Nennt nur der Content-Type-Header ein abweichendes Charset, wird wie
+        bisher dekodiert (siehe ``_response_payload``).
+
         Returns:
-            XML-Inhalt der Sitemap als String.
+            XML-Inhalt der Sitemap (Bytes per HTTP, String aus lokaler Datei).
 
         Raises:
             SitemapError: Wenn die Sitemap nicht geladen werden kann.
@@ -96,35 +132,51 @@ class SitemapParser:
         if is_local_file(self.sitemap_url):
             return self._read_local_file(self.sitemap_url)
 
-        max_retries = 3
-        last_error = None
+        if self._client is not None:
+            return await self._get_with_retries(self._client)
 
         # Cookies fuer httpx aufbereiten: {"name": "x", "value": "y"} -> httpx.Cookies
-        jar = httpx.Cookies()
-        for c in self.cookies:
-            jar.set(c["name"], c["value"])
+        jar = httpx.Cookies({c["name"]: c["value"] for c in self.cookies})
+        try:
+            # Ein Client fuer alle Versuche - Verbindung und TLS-Session
+            # bleiben ueber die Retries hinweg im Pool.
+            client = httpx.AsyncClient(
+                timeout=30.0,
+                follow_redirects=True,
+                verify=False,
+                cookies=jar,
+                proxy=self.proxy or None,
+            )
+        except Exception as e:
+            raise SitemapError(t("sitemap.fetch_failed", retries=_FETCH_RETRIES, error=e)) from e
+        async with client:
+            return await self._get_with_retries(client)
 
-        for attempt in range(max_retries):
+    async def _get_with_retries(self, client: httpx.AsyncClient) -> str | bytes:
+        """Laedt die Sitemap-URL mit exponentiellem Backoff zwischen den Versuchen.
+
+        Args:
+            client: Der zu verwendende HTTP-Client.
+
+        Returns:
+            Inhalt der Antwort (siehe ``_response_payload``).
+
+        Raises:
+            SitemapError: Wenn alle Versuche fehlschlagen.
+        """
+        last_error = None
+        for attempt in range(_FETCH_RETRIES):
             try:
-                async with httpx.AsyncClient(
-                    timeout=30.0,
-                    follow_redirects=True,
-                    verify=False,
-                    cookies=jar,
-                    proxy=self.proxy or None,
-                ) as client:
-                    response = await client.get(self.sitemap_url)
-                    response.raise_for_status()
-                    return response.text
+                response = await client.get(self.sitemap_url)
+                response.raise_for_status()
+                return _response_payload(response)
             except Exception as e:
                 last_error = e
-                if attempt < max_retries - 1:
-                    import asyncio
-
+                if attempt < _FETCH_RETRIES - 1:
                     wait_time = 5 * (2**attempt)
                     await asyncio.sleep(wait_time)
 
-        raise SitemapError(t("sitemap.fetch_failed", retries=max_retries, error=last_error))
+        raise SitemapError(t("sitemap.fetch_failed", retries=_FETCH_RETRIES, error=last_error))
 
     @staticmethod
     def _read_local_file(file_path: str) -> str:
@@ -149,11 +201,16 @@ class SitemapParser:
         except Exception as e:
             raise SitemapError(t("sitemap.file_read_error", path=file_path, error=e)) from e
 
-    def _parse_xml(self, xml_content: str) -> list[str]:
+    def _parse_xml(self, xml_content: str | bytes) -> list[str]:
         """Parst den XML-Inhalt und extrahiert URLs.
 
+        Liest die Sitemap als Ereignis-Strom statt als kompletten Baum: jeder
+        ``<url>``/``<sitemap>``-Eintrag wird nach dem Auslesen seiner ``<loc>``
+        sofort wieder verworfen. Bei Sitemaps mit zehntausenden Eintraegen
+        bleibt so nur die URL-Liste im Speicher, nicht das ganze Dokument.
+
         Args:
-            xml_content: XML-String der Sitemap.
+            xml_content: XML-Inhalt der Sitemap als String oder rohe Bytes.
 
         Returns:
             Liste der gefundenen URLs.
@@ -161,42 +218,63 @@ class SitemapParser:
         Raises:
             SitemapError: Wenn das XML nicht geparst werden kann.
         """
+        index_urls: list[str] = []
+        page_urls: list[str] = []
+        # Fallback ohne Namespace (manche Sitemaps haben keinen)
+        plain_page_urls: list[str] = []
+        plain_index_urls: list[str] = []
+        targets = {
+            _NS_SITEMAP: (_NS_LOC, index_urls, False),
+            _NS_URL: (_NS_LOC, page_urls, True),
+            "url": ("loc", plain_page_urls, True),
+            "sitemap": ("loc", plain_index_urls, True),
+        }
+
+        root: ET.Element | None = None
+        depth = 0
+        parser = ET.XMLPullParser(events=("start", "end"))
+
+        def drain() -> None:
+            nonlocal root, depth
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+                depth -= 1
+                # Nur direkte Kinder der Wurzel zaehlen (wie findall("url/loc")).
+                if depth != 1 or root is None:
+                    continue
+                target = targets.get(elem.tag)
+                if target is not None:
+                    loc_tag, bucket, sanitize = target
+                    loc = elem.find(loc_tag)
+                    if loc is not None and loc.text:
+                        url = loc.text.strip()
+                        bucket.append(_sanitize_url(url) if sanitize else url)
+                # Verarbeitetes Kind sofort loswerden - es ist immer das erste.
+                root.remove(elem)
+
         try:
-            root = ET.fromstring(xml_content)
+            # Stueckweise fuettern und dazwischen abholen - sonst staut sich
+            # doch wieder das ganze Dokument in der Ereignis-Warteschlange.
+            for offset in range(0, len(xml_content), _PARSE_CHUNK):
+                parser.feed(xml_content[offset : offset + _PARSE_CHUNK])
+                drain()
+            parser.close()
+            drain()
         except ET.ParseError as e:
             raise SitemapError(t("sitemap.xml_parse_error", error=e)) from e
 
-        urls: list[str] = []
-
-        # Sitemapindex: enthaelt <sitemap><loc>...</loc></sitemap>
-        sitemap_entries = root.findall(f"{{{SITEMAP_NS}}}sitemap/{{{SITEMAP_NS}}}loc")
-        if sitemap_entries:
-            # Sitemapindex gefunden - wir geben die Sub-Sitemap-URLs zurueck
-            # In einer spaeteren Version koennten wir diese rekursiv laden
-            for entry in sitemap_entries:
-                if entry.text:
-                    urls.append(entry.text.strip())
-            return urls
-
-        # Normale Sitemap: enthaelt <url><loc>...</loc></url>
-        url_entries = root.findall(f"{{{SITEMAP_NS}}}url/{{{SITEMAP_NS}}}loc")
-        for entry in url_entries:
-            if entry.text:
-                urls.append(_sanitize_url(entry.text.strip()))
-
-        # Fallback ohne Namespace (manche Sitemaps haben keinen)
-        if not urls:
-            url_entries = root.findall("url/loc")
-            for entry in url_entries:
-                if entry.text:
-                    urls.append(_sanitize_url(entry.text.strip()))
-
-            sitemap_entries = root.findall("sitemap/loc")
-            for entry in sitemap_entries:
-                if entry.text:
-                    urls.append(_sanitize_url(entry.text.strip()))
-
-        return urls
+        # Sitemapindex: enthaelt <sitemap><loc>...</loc></sitemap> - wir geben
+        # die Sub-Sitemap-URLs zurueck (in einer spaeteren Version koennten wir
+        # diese rekursiv laden).
+        if index_urls:
+            return index_urls
+        if page_urls:
+            return page_urls
+        return plain_page_urls + plain_index_urls
 
 
 async def discover_sitemap(
@@ -233,9 +311,7 @@ async def discover_sitemap(
     origin = urlunparse((parsed.scheme, parsed.netloc, "", "", "", ""))
 
     # Cookies aufbereiten
-    jar = httpx.Cookies()
-    for c in cookies or []:
-        jar.set(c["name"], c["value"])
+    jar = httpx.Cookies({c["name"]: c["value"] for c in cookies or []})
 
     async with httpx.AsyncClient(
         timeout=15.0,
@@ -260,14 +336,22 @@ async def discover_sitemap(
         except Exception:
             log(f"    {t('sitemap.discovery_robots_unreachable')}")
 
-        # Phase 2: Typische Pfade durchprobieren
+        # Phase 2: Typische Pfade durchprobieren - alle Anfragen gleichzeitig,
+        # ausgewertet wird aber in Prioritaetsreihenfolge: der erste gueltige
+        # Kandidat der Liste gewinnt, auch wenn ein spaeterer schneller antwortet.
         log(f"    {t('sitemap.discovery_trying_paths')}")
-        for path in _COMMON_SITEMAP_PATHS:
-            candidate = f"{origin}{path}"
-            log(f"    {t('sitemap.discovery_testing', url=candidate)}")
-            if await _is_valid_sitemap(client, candidate):
-                log(f"    [green]{t('sitemap.discovery_found', url=candidate)}[/green]")
-                return candidate
+        candidates = [f"{origin}{path}" for path in _COMMON_SITEMAP_PATHS]
+        checks = [asyncio.create_task(_is_valid_sitemap(client, candidate)) for candidate in candidates]
+        try:
+            for candidate, check in zip(candidates, checks, strict=True):
+                log(f"    {t('sitemap.discovery_testing', url=candidate)}")
+                if await check:
+                    log(f"    [green]{t('sitemap.discovery_found', url=candidate)}[/green]")
+                    return candidate
+        finally:
+            for check in checks:
+                check.cancel()
+            await asyncio.gather(*checks, return_exceptions=True)
 
     raise SitemapError(
         t(
@@ -288,14 +372,7 @@ def _parse_robots_sitemaps(robots_text: str) -> list[str]:
     Returns:
         Liste der gefundenen Sitemap-URLs.
     """
-    urls: list[str] = []
-    for line in robots_text.splitlines():
-        stripped = line.strip()
-        if stripped.lower().startswith("sitemap:"):
-            url = stripped[len("sitemap:") :].strip()
-            if url:
-                urls.append(url)
-    return urls
+    return _ROBOTS_SITEMAP_RE.findall(robots_text)
 
 
 async def _is_valid_sitemap(client: httpx.AsyncClient, url: str) -> bool:
@@ -338,9 +415,39 @@ def _sanitize_url(url: str) -> str:
     Returns:
         Bereinigte URL.
     """
+    # Der Normalfall (keine Klammern) kommt ohne neue Strings aus.
+    if "(" not in url and ")" not in url:
+        return url
     return url.replace("(", "%28").replace(")", "%29")
 
 
+def _response_payload(response: httpx.Response) -> str | bytes:
+    """Liefert die Sitemap-Antwort als rohe Bytes - oder dekodiert, wo noetig.
+
+    Der XML-Parser kennt nur die Deklaration im Dokument (ohne Angabe: UTF-8).
+    Nennt der Content-Type-Header ein anderes Charset (z.B. ``iso-8859-1`` ohne
+    ``encoding=`` im Dokument), gilt wie bei ``response.text`` der Header.
+
+    Args:
+        response: Die erfolgreiche HTTP-Antwort.
+
+    Returns:
+        Bytes wenn Header und Dokument dasselbe Encoding meinen, sonst der Text.
+    """
+    charset = response.charset_encoding
+    if not charset:
+        return response.content
+    content = response.content
+    match = _XML_ENCODING_RE.match(content[:256])
+    declared = match.group(1).decode("ascii") if match else "utf-8"
+    try:
+        if codecs.lookup(charset).name == codecs.lookup(declared).name:
+            return content
+    except LookupError:
+        pass
+    return response.text
+
+
 class SitemapError(Exception):
     """Fehler beim Laden oder Parsen einer Sitemap."""
 
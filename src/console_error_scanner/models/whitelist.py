@@ -5,7 +5,9 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
-from fnmatch import fnmatch
+import os
+import re
+from fnmatch import translate
 from pathlib import Path
 
 from .scan_result import ScanResult
@@ -13,6 +15,17 @@ from .scan_result import ScanResult
 logger = logging.getLogger(__name__)
 
 
+# Gross-/Kleinschreibung erledigt re.IGNORECASE - die Meldung muss dafuer nicht
+# kopiert werden. Nur wo normcase mehr tut als lower() (Windows: "/" -> "\\"),
+# wird sie wie bei ``fnmatch`` noch umgewandelt.
+_NORMCASE_REWRITES = os.path.normcase("a/") != "a/"
+
+
+def _normalize(text: str) -> str:
+    """Normalisiert eine Meldung wie ``fnmatch`` - ohne Kopie wo normcase nichts aendert."""
+    return os.path.normcase(text) if _NORMCASE_REWRITES else text
+
+
 class Whitelist:
     """Whitelist mit Wildcard-Patterns zum Filtern bekannter Fehler.
 
@@ -31,6 +44,12 @@ class Whitelist:
         """
         self.patterns = patterns
         self.path = path
+        # Alle Patterns als EIN Regex - pro Meldung ein Match statt einem
+        # fnmatch-Aufruf je Pattern. ``patterns`` ist oeffentlich und wird auch
+        # direkt veraendert, daher wird gegen den Stand beim Kompilieren geprueft.
+        self._compiled_for: tuple[str, ...] = ()
+        self._single: tuple[re.Pattern[str], ...] = ()
+        self._combined: re.Pattern[str] | None = None
 
     @staticmethod
     def load(path: str) -> Whitelist:
@@ -77,11 +96,32 @@ class Whitelist:
         Returns:
             True wenn die Meldung einem Pattern entspricht.
         """
-        if not message or not self.patterns:
+        if not message:
             return False
+        combined = self._matcher()
+        return combined is not None and combined.match(_normalize(message)) is not None
 
-        message_lower = message.lower()
-        return any(fnmatch(message_lower, pattern.lower()) for pattern in self.patterns)
+    def _matcher(self) -> re.Pattern[str] | None:
+        """Liefert das Sammel-Regex aller Patterns (bei Aenderung neu gebaut).
+
+        Returns:
+            Kompiliertes Regex oder None wenn keine Patterns vorhanden sind.
+        """
+        self._compile()
+        return self._combined
+
+    def _compile(self) -> None:
+        """Uebersetzt die Patterns einzeln und als Sammel-Regex - nur nach Aenderungen."""
+        current = tuple(self.patterns)
+        if current == self._compiled_for:
+            return
+        self._compiled_for = current
+        # Reine ASCII-Patterns (der Normalfall) duerfen mit re.ASCII laufen: die
+        # Case-Folding-Pruefung bleibt dann 7-bit. Sobald ein Pattern Umlaute
+        # o.ae. enthaelt, gilt fuer alle das volle Unicode-Case-Folding.
+        flags = re.IGNORECASE | (re.ASCII if all(p.isascii() for p in current) else 0)
+        self._single = tuple(re.compile(translate(os.path.normcase(p)), flags) for p in current)
+        self._combined = re.compile("|".join(f"(?:{rx.pattern})" for rx in self._single), flags) if current else None
 
     def apply(self, result: ScanResult) -> int:
         """Markiert gematchte Errors in einem ScanResult als whitelisted.
@@ -92,9 +132,17 @@ class Whitelist:
         Returns:
             Anzahl der neu als whitelisted markierten Errors.
         """
+        # Haeufigster Fall: keine Whitelist konfiguriert oder Seite fehlerfrei.
+        errors = result.errors
+        if not errors or not self.patterns:
+            return 0
+        combined = self._matcher()
+        if combined is None:
+            return 0
+        match = combined.match
         count = 0
-        for error in result.errors:
-            if not error.whitelisted and self.is_whitelisted(error.message):
+        for error in errors:
+            if not error.whitelisted and error.message and match(_normalize(error.message)):
                 error.whitelisted = True
                 count += 1
         return count
@@ -110,8 +158,11 @@ class Whitelist:
             result:
                 Das ScanResult dessen Errors neu klassifiziert werden.
         """
+        combined = self._matcher()
         for error in result.errors:
-            error.whitelisted = self.is_whitelisted(error.message)
+            error.whitelisted = (
+                combined is not None and bool(error.message) and combined.match(_normalize(error.message)) is not None
+            )
 
     @staticmethod
     def pattern_for_message(message: str) -> str:
@@ -164,8 +215,9 @@ class Whitelist:
         """
         if not message:
             return []
-        message_lower = message.lower()
-        return [p for p in self.patterns if fnmatch(message_lower, p.lower())]
+        self._compile()
+        text = _normalize(message)
+        return [p for p, rx in zip(self._compiled_for, self._single, strict=True) if rx.match(text)]
 
     def remove_pattern(self, pattern: str) -> bool:
         """Entfernt ein exaktes Pattern.
@@ -192,10 +244,7 @@ class Whitelist:
         Returns:
             Liste der entfernten Patterns.
         """
-        if not message:
-            return []
-        message_lower = message.lower()
-        removed = [p for p in self.patterns if fnmatch(message_lower, p.lower())]
+        removed = self.patterns_matching(message)
         if removed:
             self.patterns = [p for p in self.patterns if p not in removed]
         return removed
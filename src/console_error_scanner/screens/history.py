@@ -6,6 +6,8 @@ eines ausgewaehlten Scans.
 
 from __future__ import annotations
 
+import functools
+
 from textual import on
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -99,37 +101,19 @@ class HistoryScreen(ModalScreen[HistoryEntry | None]):
                     t("history.col_params"),
                 )
                 for idx, entry in enumerate(self._entries, start=1):
-                    # Datum kuerzen
-                    date_str = entry.timestamp[:16].replace("T", " ") if entry.timestamp else "?"
-
-                    # Hostname extrahieren
-                    from urllib.parse import urlparse
-
-                    try:
-                        host = urlparse(entry.sitemap_url).hostname or entry.sitemap_url
-                    except Exception:
-                        host = entry.sitemap_url
-
-                    # Parameter kompakt zusammenbauen
-                    params = []
-                    if entry.cookies:
-                        cookie_names = ", ".join(c.get("name", "?") for c in entry.cookies)
-                        params.append(f"--cookie {cookie_names}")
-                    if entry.whitelist_path:
-                        params.append(f"--whitelist {entry.whitelist_path}")
-                    if entry.url_filter:
-                        params.append(f"--filter {entry.url_filter}")
-                    if entry.console_level != "warn":
-                        params.append(f"--level {entry.console_level}")
-                    if entry.concurrency != 8:
-                        params.append(f"-c {entry.concurrency}")
-                    if entry.timeout != 60:
-                        params.append(f"-t {entry.timeout}")
-                    if entry.user_agent:
-                        params.append("--user-agent ...")
-                    if not entry.accept_consent:
-                        params.append("--no-consent")
-                    param_str = "  ".join(params) if params else "-"
+                    date_str = entry.display_timestamp
+                    host = entry.display_host
+
+                    param_str = _format_params(
+                        tuple(c.get("name", "?") for c in entry.cookies),
+                        entry.whitelist_path,
+                        entry.url_filter,
+                        entry.console_level,
+                        entry.concurrency,
+                        entry.timeout,
+                        bool(entry.user_agent),
+                        entry.accept_consent,
+                    )
 
                     table.add_row(str(idx), date_str, host, param_str, key=str(idx))
 
@@ -185,3 +169,52 @@ class HistoryScreen(ModalScreen[HistoryEntry | None]):
     def action_close(self) -> None:
         """Schließt den Dialog ohne Auswahl (ESC/q)."""
         self.dismiss(None)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_params(
+    cookie_names: tuple[str, ...],
+    whitelist_path: str,
+    url_filter: str,
+    console_level: str,
+    concurrency: int,
+    timeout: int,
+    has_user_agent: bool,
+    accept_consent: bool,
+) -> str:
+    """Baut die kompakte Parameter-Spalte der History-Tabelle.
+
+    Gecacht ueber die (hashbaren) Felder eines Eintrags - beim erneuten
+    Oeffnen der History sind die Zeilen dieselben.
+
+    Args:
+        cookie_names: Namen der Cookies des Scans.
+        whitelist_path: Pfad zur Whitelist oder leer.
+        url_filter: URL-Filter oder leer.
+        console_level: Console-Level (error/warn/all).
+        concurrency: Parallele Browser-Tabs.
+        timeout: Timeout pro Seite in Sekunden.
+        has_user_agent: True wenn ein eigener User-Agent gesetzt war.
+        accept_consent: True=Consent akzeptieren.
+
+    Returns:
+        Nicht-Default-Parameter als CLI-artige Kurzform oder "-".
+    """
+    params = []
+    if cookie_names:
+        params.append(f"--cookie {', '.join(cookie_names)}")
+    if whitelist_path:
+        params.append(f"--whitelist {whitelist_path}")
+    if url_filter:
+        params.append(f"--filter {url_filter}")
+    if console_level != "warn":
+        params.append(f"--level {console_level}")
+    if concurrency != 8:
+        params.append(f"-c {concurrency}")
+    if timeout != 60:
+        params.append(f"-t {timeout}")
+    if has_user_agent:
+        params.append("--user-agent ...")
+    if not accept_consent:
+        params.append("--no-consent")
+    return "  ".join(params) if params else "-"
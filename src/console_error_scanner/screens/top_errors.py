@@ -21,6 +21,20 @@ from ..models.scan_result import ErrorType, ScanResult
 MAX_MSG_LEN = 80
 # Breite des Balkens
 BAR_WIDTH = 40
+# Alle moeglichen Balken vorab (Index = Laenge) statt je Eintrag neu zu bauen.
+_BARS = tuple("\u2588" * n for n in range(BAR_WIDTH + 1))
+_BAR_INDENT = " " * 6  # Einrueckung passend zum Label
+
+# Sektionen in Anzeigereihenfolge: (Typ, Titel, Balkenfarbe, Keys sind URLs).
+# Console-Meldungen werden normalisiert gruppiert, HTTP-Fehler nach Quelle.
+_SECTIONS: tuple[tuple[ErrorType, str, str, bool], ...] = (
+    (ErrorType.CONSOLE_ERROR, "Console Errors", "red", False),
+    (ErrorType.CONSOLE_WARNING, "Console Warnings", "yellow", False),
+    (ErrorType.HTTP_404, "HTTP 404", "yellow", True),
+    (ErrorType.HTTP_4XX, "HTTP 4xx", "yellow", True),
+    (ErrorType.HTTP_5XX, "HTTP 5xx", "red", True),
+)
+_CONSOLE_TYPES = (ErrorType.CONSOLE_ERROR, ErrorType.CONSOLE_WARNING)
 
 
 class TopErrorsScreen(ModalScreen):
@@ -96,10 +110,20 @@ class TopErrorsScreen(ModalScreen):
         """Erstellt das Modal-Layout."""
         with VerticalScroll():
             yield Static(t("top_errors.title"), id="top-title")
-            yield Static(self._build_chart(), id="top-content")
+            # Inhalt erst nach dem ersten Paint (siehe on_mount) - bei grossen
+            # Scans dauert das Auszaehlen spuerbar, der Rahmen steht sofort.
+            yield Static("", id="top-content")
             with Horizontal(id="top-buttons"):
                 yield Button(t("binding.close"), variant="primary", id="top-close")
 
+    def on_mount(self) -> None:
+        """Baut das Diagramm nach dem ersten Refresh des Dialogs."""
+        self.call_after_refresh(self._show_chart)
+
+    def _show_chart(self) -> None:
+        """Fuellt den Inhaltsbereich mit dem Balkendiagramm."""
+        self.query_one("#top-content", Static).update(self._build_chart())
+
     @on(Button.Pressed, "#top-close")
     def _on_close_button(self) -> None:
         self.dismiss()
@@ -112,81 +136,56 @@ class TopErrorsScreen(ModalScreen):
         """
         text = Text()
 
-        # Alle Fehler sammeln und nach Typ gruppieren
-        console_counter: Counter = Counter()
-        warning_counter: Counter = Counter()
-        http_404_counter: Counter = Counter()
-        http_4xx_counter: Counter = Counter()
-        http_5xx_counter: Counter = Counter()
-
+        # Alle Fehler sammeln und nach Typ gruppieren - ein Counter je Typ,
+        # ausgewaehlt per Dict-Lookup statt if/elif-Kette.
+        # Im selben Durchlauf: aktive Fehler je Seite (= total_error_count,
+        # > 0 heisst has_issues) fuer die Seiten-Rangliste.
+        counters: dict[ErrorType, Counter] = {error_type: Counter() for error_type in ErrorType}
+        page_errors: list[tuple[str, int]] = []
         for result in self._results:
+            active = 0
             for error in result.errors:
                 if error.whitelisted:
                     continue
-                if error.error_type == ErrorType.CONSOLE_ERROR:
-                    msg = _normalize_message(error.message)
-                    console_counter[msg] += 1
-                elif error.error_type == ErrorType.CONSOLE_WARNING:
-                    msg = _normalize_message(error.message)
-                    warning_counter[msg] += 1
-                elif error.error_type == ErrorType.HTTP_404:
-                    http_404_counter[error.source or error.message] += 1
-                elif error.error_type == ErrorType.HTTP_4XX:
-                    http_4xx_counter[error.source or error.message] += 1
-                elif error.error_type == ErrorType.HTTP_5XX:
-                    http_5xx_counter[error.source or error.message] += 1
+                active += 1
+                error_type = error.error_type
+                if error_type in _CONSOLE_TYPES:
+                    key = _normalize_message(error.message)
+                else:
+                    key = error.source or error.message
+                counters[error_type][key] += 1
+            if active:
+                page_errors.append((result.url, active))
 
         # Gesamtzaehler
-        total_errors = (
-            sum(console_counter.values())
-            + sum(warning_counter.values())
-            + sum(http_404_counter.values())
-            + sum(http_4xx_counter.values())
-            + sum(http_5xx_counter.values())
-        )
+        total_errors = sum(counter.total() for counter in counters.values())
 
         if total_errors == 0:
             text.append(t("top_errors.no_errors"), style="green bold")
             return text
 
         text.append(t("top_errors.total", count=total_errors), style="bold")
-        pages_with_errors = sum(1 for r in self._results if r.has_issues)
-        text.append(f"{t('top_errors.pages', count=pages_with_errors)}\n", style="bold")
+        text.append(f"{t('top_errors.pages', count=len(page_errors))}\n", style="bold")
         text.append("\n")
 
-        # === Console Errors Top 10 ===
-        if console_counter:
-            _append_section(text, "Console Errors", console_counter, "red")
-
-        # === Console Warnings Top 10 ===
-        if warning_counter:
-            _append_section(text, "Console Warnings", warning_counter, "yellow")
-
-        # === HTTP 404 Top 10 === (Eintraege sind URLs -> Hover-Links)
-        if http_404_counter:
-            _append_section(text, "HTTP 404", http_404_counter, "yellow", link_fn=self._link)
-
-        # === HTTP 4xx Top 10 ===
-        if http_4xx_counter:
-            _append_section(text, "HTTP 4xx", http_4xx_counter, "yellow", link_fn=self._link)
-
-        # === HTTP 5xx Top 10 ===
-        if http_5xx_counter:
-            _append_section(text, "HTTP 5xx", http_5xx_counter, "red", link_fn=self._link)
+        # === Top 10 je Fehlertyp === (HTTP-Eintraege sind URLs -> Hover-Links)
+        for error_type, title, color, is_url in _SECTIONS:
+            counter = counters[error_type]
+            if counter:
+                _append_section(text, title, counter, color, link_fn=self._link if is_url else None)
 
         # === Seiten mit den meisten Fehlern ===
         text.append("\u2500" * 60, style="dim")
         text.append("\n\n")
         text.append(f"{t('top_errors.most_errors')}\n", style="bold cyan underline")
         text.append("\n")
-        page_errors = [(r.url, r.total_error_count) for r in self._results if r.has_issues]
         page_errors.sort(key=lambda x: x[1], reverse=True)
 
         if page_errors:
             max_page_count = page_errors[0][1]
             for rank, (url, count) in enumerate(page_errors[:10], 1):
                 label = self._link(_truncate(url, MAX_MSG_LEN), url)
-                _append_bar_entry(text, rank, label, count, max_page_count, "cyan")
+                _append_bar_entry(text, rank, label, count, max_page_count, "bold cyan")
 
         return text
 
@@ -217,11 +216,15 @@ def _append_section(
     text.append(f"{title}\n", style=f"bold {color} underline")
     text.append("\n")
 
-    max_count = counter.most_common(1)[0][1] if counter else 1
-    for rank, (msg, count) in enumerate(counter.most_common(10), 1):
+    bar_style = f"bold {color}"  # einmal je Sektion, nicht je Eintrag
+    # most_common(n) nutzt intern bereits heapq.nlargest - nur einmal aufrufen
+    # und das Maximum aus dem ersten Eintrag nehmen.
+    top = counter.most_common(10)
+    max_count = top[0][1] if top else 1
+    for rank, (msg, count) in enumerate(top, 1):
         display = _truncate(msg, MAX_MSG_LEN)
         label: str | Text = link_fn(display, msg) if link_fn else display
-        _append_bar_entry(text, rank, label, count, max_count, color)
+        _append_bar_entry(text, rank, label, count, max_count, bar_style)
 
     text.append("\n")
 
@@ -241,8 +244,9 @@ def _normalize_message(msg: str) -> str:
     if not msg:
         return t("top_errors.empty")
 
-    # Erste Zeile nehmen
-    first_line = msg.split("\n")[0].strip()
+    # Erste Zeile nehmen - maxsplit=1, damit lange Stack-Traces nicht
+    # komplett in Zeilen zerlegt werden.
+    first_line = msg.split("\n", 1)[0].strip()
 
     # Sehr lange Meldungen kuerzen
     if len(first_line) > 120:
@@ -272,7 +276,7 @@ def _append_bar_entry(
     label: str | Text,
     count: int,
     max_count: int,
-    color: str,
+    bar_style: str,
 ) -> None:
     """Fuegt einen Chart-Eintrag hinzu (Label ueber Balken).
 
@@ -286,7 +290,7 @@ def _append_bar_entry(
         label: Beschreibungstext.
         count: Anzahl.
         max_count: Maximaler Wert (fuer Balkenbreite).
-        color: Farbe des Balkens.
+        bar_style: Rich-Style des Balkens (z.B. "bold red").
     """
     # Zeile 1: Rang + Label (Label kann ein klickbarer Text sein)
     text.append(f"  {rank:2d}. ", style="bold")
@@ -297,8 +301,6 @@ def _append_bar_entry(
         text.append(f"{label}\n", style="")
 
     # Zeile 2: Eingerueckter Balken + Anzahl
-    bar_len = max(1, int(BAR_WIDTH * count / max_count)) if max_count > 0 else 1
-    bar = "\u2588" * bar_len
-    padding = " " * 6  # Einrueckung passend zum Label
-    text.append(f"{padding}{bar}", style=f"bold {color}")
+    bar_len = min(BAR_WIDTH, max(1, BAR_WIDTH * count // max_count)) if max_count > 0 else 1
+    text.append(_BAR_INDENT + _BARS[bar_len], style=bar_style)
     text.append(f" {count}x\n", style="bold")
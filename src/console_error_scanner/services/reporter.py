@@ -2,15 +2,32 @@
 
 from __future__ import annotations
 
+import io
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import TextIO
 
 from .. import __version__
 from ..i18n import t
-from ..models.scan_result import ScanResult, ScanSummary, format_page_size
+from ..models.scan_result import ErrorType, PageError, ScanResult, ScanSummary, format_page_size
 from .site_score import compute_site_score
 
+# Anzeige-Label je Fehlertyp (HTML-Report, JIRA-Tabellen, Text-Export).
+_TYPE_LABELS: dict[ErrorType, str] = {
+    ErrorType.CONSOLE_ERROR: "Console",
+    ErrorType.CONSOLE_WARNING: "Warning",
+    ErrorType.HTTP_404: "HTTP 404",
+    ErrorType.HTTP_4XX: "HTTP 4xx",
+    ErrorType.HTTP_5XX: "HTTP 5xx",
+}
+# Fertiges Typ-Badge fuer aktive Fehler im HTML-Report - ein Lookup je Fehler
+# statt Enum-Wert und Label einzeln einzusetzen.
+_TYPE_BADGES: dict[ErrorType, str] = {
+    error_type: f"<span class='error-type {error_type.value}'>{label}</span>"
+    for error_type, label in _TYPE_LABELS.items()
+}
+
 
 class Reporter:
     """Erzeugt Reports aus Scan-Ergebnissen."""
@@ -37,7 +54,8 @@ class Reporter:
         """
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(Reporter.build_json(results, summary, error_weight), encoding="utf-8")
+        with path.open("w", encoding="utf-8") as out:
+            Reporter._write_json(out, results, summary, error_weight)
 
         return str(path.resolve())
 
@@ -56,14 +74,49 @@ class Reporter:
         Returns:
             JSON-String (indentiert, mit echten Umlauten).
         """
+        out = io.StringIO()
+        Reporter._write_json(out, results, summary, error_weight)
+        return out.getvalue()
+
+    @staticmethod
+    def _write_json(out: TextIO, results: list[ScanResult], summary: ScanSummary, error_weight: int) -> None:
+        """Schreibt den JSON-Report Seite fuer Seite in ``out``.
+
+        Das Ergebnis ist byte-gleich zu ``json.dumps(report, indent=2,
+        ensure_ascii=False)``, haelt aber nie den ganzen Report als einen
+        String im Speicher: jede Seite wird einzeln (mit dem C-Encoder)
+        serialisiert und auf die Tiefe des ``results``-Arrays eingerueckt.
+        Echte Zeilenumbrueche kommen in JSON nur zwischen Tokens vor - in
+        Strings stehen sie als ``\\n`` - das Einruecken ist also sicher.
+
+        Args:
+            out:
+                Ziel (Datei oder StringIO).
+            results:
+                Die zu exportierenden Scan-Ergebnisse.
+            summary:
+                Passende Zusammenfassung zu den Ergebnissen.
+            error_weight:
+                Gewicht der Fehlerquote (Prozent) fuer den Site-Score.
+        """
         score = compute_site_score(results, error_weight=error_weight)
-        report = {
+        head = {
             "generated_at": datetime.now().isoformat(),
             "summary": summary.to_dict(),
             "site_score": score.to_dict(),
-            "results": [r.to_dict() for r in results],
         }
-        return json.dumps(report, indent=2, ensure_ascii=False)
+        # "{ ... \n}" ohne die schliessende Klammer - das Array kommt dahinter.
+        out.write(json.dumps(head, indent=2, ensure_ascii=False)[:-2])
+        out.write(',\n  "results": [')
+        if not results:
+            out.write("]\n}")
+            return
+        separator = "\n    "
+        for r in results:
+            out.write(separator)
+            out.write(json.dumps(r.to_dict(), indent=2, ensure_ascii=False).replace("\n", "\n    "))
+            separator = ",\n    "
+        out.write("\n  ]\n}")
 
     @staticmethod
     def build_text(results: list[ScanResult]) -> str:
@@ -117,89 +170,97 @@ class Reporter:
             t("summary.big_fish"), res_entries
         )
 
-        # Ergebnis-Zeilen aufbauen
-        result_rows = []
+        # Zaehler-Karten: (Label, Wert, CSS-Klasse falls Wert > 0, sonst "ok").
+        counter_cards = (
+            (t("report.with_errors"), summary.urls_with_errors, "error"),
+            ("Console Errors", summary.total_console_errors, "error"),
+            ("HTTP 404", summary.total_http_404, "warning"),
+            ("HTTP 4xx", summary.total_http_4xx, "warning"),
+            ("HTTP 5xx", summary.total_http_5xx, "error"),
+            ("Timeouts", summary.total_timeouts, "warning"),
+        )
+        summary_cards = "\n".join(
+            [
+                _summary_card(
+                    t("report.site_score"),
+                    f'{score.score} %<span class="grade"> ({score.grade})</span>',
+                    _score_class(score.score),
+                    card_class="score-card",
+                ),
+                _summary_card(t("report.avg_size"), format_page_size(score.avg_page_size_bytes)),
+                _summary_card(t("report.urls_total"), summary.total_urls),
+                _summary_card(t("report.scanned"), summary.scanned_urls, "ok"),
+                *(_summary_card(label, value, level if value > 0 else "ok") for label, value, level in counter_cards),
+                _summary_card("Ignored", summary.total_ignored, "ignored", card_class="ignored-card"),
+                _summary_card(t("report.duration"), f"{duration_s:.1f}s"),
+            ]
+        )
+
+        # Ergebnis-Zeilen aufbauen - alle Fragmente landen direkt in EINER Liste,
+        # die am Ende einmal gejoint wird (keine Zwischen-Strings je Fehlerliste).
+        result_rows: list[str] = []
+        append = result_rows.append
         for idx, r in enumerate(results, 1):
-            if r.has_errors:
+            active_errors: list[PageError] = []
+            ignored_errors: list[PageError] = []
+            for e in r.errors:
+                (ignored_errors if e.whitelisted else active_errors).append(e)
+
+            counts = r.snapshot()
+            if counts.with_errors:
                 status_class = "error"
-            elif r.has_issues:
+            elif active_errors:
                 status_class = "warning"
             else:
                 status_class = "ok"
-            error_details = ""
-            ignored_details = ""
-
-            active_errors = [e for e in r.errors if not e.whitelisted]
-            ignored_errors = [e for e in r.errors if e.whitelisted]
-
-            if active_errors:
-                detail_items = []
-                for e in active_errors:
-                    type_label = {
-                        "console_error": "Console",
-                        "http_404": "HTTP 404",
-                        "http_4xx": "HTTP 4xx",
-                        "http_5xx": "HTTP 5xx",
-                    }.get(e.error_type.value, e.error_type.value)
 
-                    source_info = ""
-                    if e.source:
-                        source_info = f" <span class='source'>({e.source}"
-                        if e.line_number:
-                            source_info += f":{e.line_number}"
-                        source_info += ")</span>"
-
-                    detail_items.append(
-                        f"<li><span class='error-type {e.error_type.value}'>{type_label}</span> "
-                        f"{_html_escape(e.message)}{source_info}</li>"
-                    )
-
-                error_details = f"<ul class='error-list'>{''.join(detail_items)}</ul>"
-
-            if ignored_errors:
-                ignored_items = []
-                for e in ignored_errors:
-                    type_label = {
-                        "console_error": "Console",
-                        "console_warning": "Warning",
-                        "http_404": "HTTP 404",
-                        "http_4xx": "HTTP 4xx",
-                        "http_5xx": "HTTP 5xx",
-                    }.get(e.error_type.value, e.error_type.value)
-
-                    ignored_items.append(
-                        f"<li><span class='error-type ignored'>{type_label}</span> {_html_escape(e.message)}</li>"
-                    )
-
-                ignored_details = (
-                    f"<div class='ignored-section'>"
-                    f"<p class='ignored-header'>{t('report.whitelist_hits', count=len(ignored_errors))}</p>"
-                    f"<ul class='error-list ignored-list'>{''.join(ignored_items)}</ul>"
-                    f"</div>"
-                )
-
-            result_rows.append(
+            url = _html_escape(r.url)
+            append(
                 f"<tr class='{status_class}'>"
                 f"<td>{idx}</td>"
                 f"<td class='status-cell'>{r.status_icon}</td>"
-                f"<td><a href='{_html_escape(r.url)}' target='_blank'>{_html_escape(r.url)}</a></td>"
+                f"<td><a href='{url}' target='_blank'>{url}</a></td>"
                 f"<td>{r.http_status_code}</td>"
                 f"<td>{_fmt_ms(r.load_time_ms)}</td>"
                 f"<td>{_fmt_ms(r.dom_content_loaded_ms)}</td>"
                 f"<td>{r.request_count if r.request_count > 0 else '-'}</td>"
                 f"<td>{format_page_size(r.page_size_bytes)}</td>"
-                f"<td>{r.console_error_count}</td>"
-                f"<td>{r.http_404_count}</td>"
-                f"<td>{r.http_4xx_count}</td>"
-                f"<td>{r.http_5xx_count}</td>"
-                f"<td class='ignored-cell'>{r.ignored_count}</td>"
+                f"<td>{counts.console_err}</td>"
+                f"<td>{counts.http_404}</td>"
+                f"<td>{counts.http_4xx}</td>"
+                f"<td>{counts.http_5xx}</td>"
+                f"<td class='ignored-cell'>{counts.ignored}</td>"
                 f"</tr>"
             )
 
-            if error_details or ignored_details:
-                result_rows.append(
-                    f"<tr class='detail-row'><td colspan='13'>{error_details}{ignored_details}</td></tr>"
+            if not (active_errors or ignored_errors):
+                continue
+
+            append("<tr class='detail-row'><td colspan='13'>")
+            if active_errors:
+                append("<ul class='error-list'>")
+                for e in active_errors:
+                    source_info = ""
+                    if e.source:
+                        line = f":{e.line_number}" if e.line_number else ""
+                        source_info = f" <span class='source'>({e.source}{line})</span>"
+
+                    append(f"<li>{_TYPE_BADGES[e.error_type]} {_html_escape(e.message)}{source_info}</li>")
+                append("</ul>")
+
+            if ignored_errors:
+                append(
+                    f"<div class='ignored-section'>"
+                    f"<p class='ignored-header'>{t('report.whitelist_hits', count=len(ignored_errors))}</p>"
+                    f"<ul class='error-list ignored-list'>"
                 )
+                for e in ignored_errors:
+                    append(
+                        f"<li><span class='error-type ignored'>{_TYPE_LABELS[e.error_type]}</span> "
+                        f"{_html_escape(e.message)}</li>"
+                    )
+                append("</ul></div>")
+            append("</td></tr>")
 
         html = f"""<!DOCTYPE html>
 <html lang="de">
@@ -269,54 +330,7 @@ class Reporter:
     <p class="timestamp">{t("report.created", timestamp=timestamp, url=_html_escape(summary.sitemap_url))}</p>
 
     <div class="summary">
-        <div class="summary-card score-card">
-            <div class="label">{t("report.site_score")}</div>
-            <div class="value {_score_class(score.score)}">{score.score} %<span class="grade"> ({score.grade})</span></div>
-        </div>
-        <div class="summary-card">
-            <div class="label">{t("report.avg_size")}</div>
-            <div class="value">{format_page_size(score.avg_page_size_bytes)}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">{t("report.urls_total")}</div>
-            <div class="value">{summary.total_urls}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">{t("report.scanned")}</div>
-            <div class="value ok">{summary.scanned_urls}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">{t("report.with_errors")}</div>
-            <div class="value {"error" if summary.urls_with_errors > 0 else "ok"}">{summary.urls_with_errors}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">Console Errors</div>
-            <div class="value {"error" if summary.total_console_errors > 0 else "ok"}">{summary.total_console_errors}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">HTTP 404</div>
-            <div class="value {"warning" if summary.total_http_404 > 0 else "ok"}">{summary.total_http_404}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">HTTP 4xx</div>
-            <div class="value {"warning" if summary.total_http_4xx > 0 else "ok"}">{summary.total_http_4xx}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">HTTP 5xx</div>
-            <div class="value {"error" if summary.total_http_5xx > 0 else "ok"}">{summary.total_http_5xx}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">Timeouts</div>
-            <div class="value {"warning" if summary.total_timeouts > 0 else "ok"}">{summary.total_timeouts}</div>
-        </div>
-        <div class="summary-card ignored-card">
-            <div class="label">Ignored</div>
-            <div class="value ignored">{summary.total_ignored}</div>
-        </div>
-        <div class="summary-card">
-            <div class="label">{t("report.duration")}</div>
-            <div class="value">{duration_s:.1f}s</div>
-        </div>
+{summary_cards}
     </div>
 
     <table>
@@ -350,7 +364,9 @@ class Reporter:
 
         path = Path(output_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(html, encoding="utf-8")
+        # Einmal kodieren, einmal schreiben - ohne TextIOWrapper dazwischen.
+        # Zeilenenden bleiben damit auf allen Plattformen LF.
+        path.write_bytes(html.encode("utf-8"))
 
         return str(path.resolve())
 
@@ -400,10 +416,11 @@ class Reporter:
             # Details mit \\ als Zellen-Umbruch (Wiki-Markup) - vorab joinen,
             # damit kein Backslash in der f-String-Expression steht.
             detail_str = " \\\\ ".join(details) if details else "-"
+            counts = r.snapshot()
             # URL als klickbaren JIRA-Link formatieren.
             lines.append(
-                f"|[{r.url}]|{http_code}|{r.status_icon}|{r.console_error_count}|"
-                f"{r.http_404_count}|{r.http_4xx_count}|{r.http_5xx_count}|{detail_str}|"
+                f"|[{r.url}]|{http_code}|{r.status_icon}|{counts.console_err}|"
+                f"{counts.http_404}|{counts.http_4xx}|{counts.http_5xx}|{detail_str}|"
             )
         return "\n".join(lines)
 
@@ -428,14 +445,15 @@ class Reporter:
         for r in errors:
             http_code = str(r.http_status_code) if r.http_status_code else "-"
             details = [Reporter._md_cell(d) for d in Reporter._error_details(r)]
+            counts = r.snapshot()
             cells = [
                 Reporter._md_cell(r.url),
                 http_code,
                 r.status_icon,
-                str(r.console_error_count),
-                str(r.http_404_count),
-                str(r.http_4xx_count),
-                str(r.http_5xx_count),
+                str(counts.console_err),
+                str(counts.http_404),
+                str(counts.http_4xx),
+                str(counts.http_5xx),
                 "<br>".join(details) if details else "-",
             ]
             lines.append(f"| {' | '.join(cells)} |")
@@ -452,18 +470,11 @@ class Reporter:
         Returns:
             Liste aus "[TYP] Meldung (Quelle:Zeile)"-Strings.
         """
-        labels = {
-            "console_error": "Console",
-            "console_warning": "Warning",
-            "http_404": "HTTP 404",
-            "http_4xx": "HTTP 4xx",
-            "http_5xx": "HTTP 5xx",
-        }
         details = []
         for e in result.errors:
             if e.whitelisted:
                 continue
-            tag = labels.get(e.error_type.value, e.error_type.value)
+            tag = _TYPE_LABELS[e.error_type]
             source = ""
             if e.source:
                 source = f" ({e.source}{f':{e.line_number}' if e.line_number else ''})"
@@ -501,6 +512,32 @@ def _score_class(score: int) -> str:
     return "error"
 
 
+def _summary_card(label: str, value: object, value_class: str = "", card_class: str = "") -> str:
+    """Baut eine Kachel fuer den Summary-Bereich des HTML-Reports.
+
+    Args:
+        label:
+            Beschriftung der Kachel.
+        value:
+            Angezeigter Wert (bereits HTML-sicher).
+        value_class:
+            Zusaetzliche CSS-Klasse des Werts (ok/warning/error/ignored).
+        card_class:
+            Zusaetzliche CSS-Klasse der Kachel.
+
+    Returns:
+        HTML-Fragment der Kachel.
+    """
+    card_css = f"summary-card {card_class}" if card_class else "summary-card"
+    value_css = f"value {value_class}" if value_class else "value"
+    return (
+        f'        <div class="{card_css}">\n'
+        f'            <div class="label">{label}</div>\n'
+        f'            <div class="{value_css}">{value}</div>\n'
+        f"        </div>"
+    )
+
+
 def _top_list_html(title: str, entries: list[tuple[str, str, int]]) -> str:
     """Baut eine "Top-Liste"-Sektion (Balken + Wert + Link) fuer den Report.
 
@@ -552,6 +589,10 @@ def _html_escape(text: str) -> str:
     Returns:
         HTML-sicherer Text.
     """
+    # Schnellweg fuer saubere Texte (die meisten URLs): fuenf ``in``-Pruefungen
+    # sind gut doppelt so schnell wie fuenf replace()-Aufrufe ohne Treffer.
+    if "&" not in text and "<" not in text and ">" not in text and '"' not in text and "'" not in text:
+        return text
     return (
         text.replace("&", "&amp;")
         .replace("<", "&lt;")
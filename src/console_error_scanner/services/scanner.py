@@ -9,7 +9,8 @@ from collections.abc import Callable
 from urllib.parse import urlparse
 
 import httpx
-from playwright.async_api import Browser, BrowserContext, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext, CDPSession, Page, async_playwright
+from rich.markup import escape as escape_markup
 
 from ..i18n import t
 from ..models.scan_result import ErrorType, PageError, PageStatus, ResourceSize, ScanResult
@@ -73,6 +74,10 @@ class Scanner:
         # Offene Browser-Kontexte, damit ein Abbruch die laufenden Seiten sofort
         # kappen kann, statt sie zu Ende laden zu lassen.
         self._open_contexts: set[BrowserContext] = set()
+        # Freie Kontexte fuer die naechste Seite. Einen Kontext anzulegen kostet
+        # pro URL spuerbar Zeit; die Semaphore begrenzt den Pool auf
+        # `concurrency` Stueck.
+        self._idle_contexts: list[BrowserContext] = []
 
     async def scan_urls(
         self,
@@ -238,11 +243,8 @@ class Scanner:
         if not self._browser or not self._browser.is_connected():
             raise RuntimeError("Browser nicht verbunden")
 
-        context = await self._browser.new_context(
-            ignore_https_errors=True,
-            java_script_enabled=True,
-            user_agent=self.user_agent,
-        )
+        context = await self._acquire_context()
+        reusable = False
         # Merken, damit ein Abbruch die laufende Seite sofort kappen kann.
         self._open_contexts.add(context)
         # Der Abbruch kann genau zwischen der letzten Pruefung und dem Anlegen des
@@ -270,7 +272,13 @@ class Scanner:
             ]
             await context.add_cookies(cookie_list)
 
-        page = await context.new_page()
+        try:
+            page = await context.new_page()
+        except Exception:
+            self._open_contexts.discard(context)
+            with contextlib.suppress(Exception):
+                await context.close()
+            raise
 
         try:
             page.set_default_timeout(self.timeout * 1000)
@@ -288,7 +296,7 @@ class Scanner:
                 """Handler fuer Audits.issueAdded - faengt CSP-Violations."""
                 issue = params.get("issue", {})
                 code = issue.get("code", "")
-                log(f"    [dim][CDP Audits] code={code}[/dim]")
+                log(f"    [dim][CDP Audits] code={escape_markup(code)}[/dim]")
                 details = issue.get("details", {})
 
                 if code == "ContentSecurityPolicyIssue":
@@ -326,7 +334,7 @@ class Scanner:
                 source = entry.get("source", "")
                 url = entry.get("url", "")
                 line = entry.get("lineNumber", 0)
-                log(f"    [dim][CDP Log] source={source} text={text[:80]}[/dim]")
+                log(f"    [dim][CDP Log] source={escape_markup(source)} text={escape_markup(text[:80])}[/dim]")
 
                 if source in ("security", "violation"):
                     result.errors.append(
@@ -364,7 +372,8 @@ class Scanner:
             def on_console(msg):
                 msg_type = msg.type
                 text = msg.text or ""
-                log(f"    [dim][Console {msg_type}] {text[:100]}[/dim]")
+                # Seitentext ist kein Rich-Markup: "[/x]" wuerde sonst die Zeile sprengen.
+                log(f"    [dim][Console {msg_type}] {escape_markup(text[:100])}[/dim]")
                 if msg_type not in captured_types:
                     return
 
@@ -466,7 +475,7 @@ class Scanner:
                     return
                 failure_text = failure or ""
                 url = request.url
-                log(f"    [dim][ReqFail] {failure_text} - {url[:80]}[/dim]")
+                log(f"    [dim][ReqFail] {escape_markup(failure_text)} - {escape_markup(url[:80])}[/dim]")
                 # Nur relevante Fehler erfassen, nicht Abbrueche durch Navigation
                 if "net::ERR_ABORTED" in failure_text:
                     return
@@ -483,9 +492,13 @@ class Scanner:
 
             # Request-Zaehler: ALLE Requests der Seite (wie Edge-Netzwerkmonitor).
             request_counter = {"n": 0}
+            # Alle Origins der Seite (inkl. Drittanbieter und iframes) - deren
+            # Speicher wird vor der Rueckgabe des Kontexts in den Pool geleert.
+            touched_origins: set[str] = set()
 
-            def on_request(_request):
+            def on_request(request):
                 request_counter["n"] += 1
+                touched_origins.add(_origin(request.url))
 
             page.on("request", on_request)
 
@@ -603,15 +616,102 @@ class Scanner:
                 result.status = PageStatus.WARNING
             else:
                 result.status = PageStatus.OK
+            touched_origins.add(_origin(result.url))
+            reusable = await self._clear_site_data(cdp_client, touched_origins)
 
         finally:
             # CDP-Session sauber schliessen
             with contextlib.suppress(Exception):
                 await cdp_client.detach()
             self._open_contexts.discard(context)
-            # Beim Abbruch ist der Kontext schon zu - das darf hier nicht knallen.
+            await self._release_context(context, page, reusable)
+
+    async def _acquire_context(self) -> BrowserContext:
+        """Liefert einen freien Browser-Kontext aus dem Pool oder legt einen an.
+
+        Kontexte eines inzwischen ersetzten Browsers (Browser-Recovery) oder
+        bereits geschlossene werden verworfen. Die Cookies eines wiederverwendeten
+        Kontexts werden geleert - die Custom-Cookies setzt ``_do_scan_page``
+        pro URL neu.
+
+        Returns:
+            Ein Kontext ohne Cookies.
+        """
+        while self._idle_contexts:
+            context = self._idle_contexts.pop()
+            if context.browser is self._browser:
+                try:
+                    await context.clear_cookies()
+                    return context
+                except Exception:
+                    pass
             with contextlib.suppress(Exception):
                 await context.close()
+        return await self._browser.new_context(
+            ignore_https_errors=True,
+            java_script_enabled=True,
+            user_agent=self.user_agent,
+        )
+
+    async def _release_context(self, context: BrowserContext, page: Page, reusable: bool) -> None:
+        """Gibt einen Kontext nach dem Scan einer Seite zurueck in den Pool.
+
+        Nur nach einem sauberen Durchlauf: nach einem Fehler oder Abbruch kann
+        der Kontext in einem unklaren Zustand sein und wird geschlossen.
+
+        Args:
+            context: Der benutzte Kontext.
+            page: Die Seite des Scans (wird immer geschlossen).
+            reusable: True wenn der Scan fehlerfrei durchgelaufen ist.
+        """
+        if reusable and not self._cancelled:
+            try:
+                await page.close()
+                self._idle_contexts.append(context)
+                return
+            except Exception:
+                pass
+        # Beim Abbruch ist der Kontext schon zu - das darf hier nicht knallen.
+        with contextlib.suppress(Exception):
+            await context.close()
+
+    @staticmethod
+    async def _clear_site_data(cdp_client: CDPSession, origins: set[str]) -> bool:
+        """Raeumt nach einer Seite auf, bevor ihr Kontext zurueck in den Pool geht.
+
+        Ein frischer Kontext startet ohne HTTP-Cache, LocalStorage, IndexedDB und
+        Service Worker. Damit Seitengewicht, Request-Zahl und Fehler nicht davon
+        abhaengen, welche Seite vorher im selben Kontext lief, wird der Cache
+        geleert und der Speicher ALLER Origins, die die Seite angefragt hat -
+        auch Consent-Manager und eingebettete Widgets von Drittanbietern.
+        Cookies leert ``_acquire_context`` beim naechsten Auschecken.
+
+        Restrisiko gegenueber einem frischen Kontext: Zustand, den Chromium nicht
+        per Origin loeschen kann (z.B. partitionierter Drittanbieter-Speicher
+        oder Ressourcen, die nie als Request sichtbar waren), kann stehen
+        bleiben. Schlaegt das Leeren fehl, wird der Kontext verworfen.
+
+        Args:
+            cdp_client: CDP-Session der gerade gescannten Seite.
+            origins: Origins (``scheme://host[:port]``) der Seite.
+
+        Returns:
+            True wenn alles geleert wurde und der Kontext wiederverwendbar ist.
+        """
+        try:
+            await cdp_client.send("Network.clearBrowserCache")
+            for origin in origins:
+                if origin:
+                    await cdp_client.send(
+                        "Storage.clearDataForOrigin",
+                        {
+                            "origin": origin,
+                            "storageTypes": "local_storage,indexeddb,websql,file_systems,service_workers,cache_storage",
+                        },
+                    )
+        except Exception:
+            return False
+        return True
 
     async def _accept_consent(
         self,
@@ -961,5 +1061,22 @@ class Scanner:
         except Exception:
             pass
 
+        # Die Kontexte sind mit dem Browser geschlossen.
+        self._idle_contexts.clear()
         self._browser = None
         self._playwright = None
+
+
+def _origin(url: str) -> str:
+    """Liefert ``scheme://host[:port]`` einer http(s)-URL, sonst "".
+
+    Args:
+        url: Die Request-URL.
+
+    Returns:
+        Der Origin oder "" fuer data:, blob: usw.
+    """
+    if not url.startswith(("http://", "https://")):
+        return ""
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
@@ -113,11 +113,13 @@ def compute_site_score(results: list[ScanResult], error_weight: int = 60) -> Sit
         return SiteScore(error_weight=weight)
 
     total = len(scanned)
-    clean = sum(1 for r in scanned if not r.has_errors)
-    total_errors = sum(
-        r.console_error_count + r.http_404_count + r.http_4xx_count + r.http_5xx_count for r in scanned
-    )
-    total_warnings = sum(r.console_warning_count for r in scanned)
+    # Ein snapshot() je Seite statt eines Fehler-Durchlaufs pro Zaehler.
+    clean = total_errors = total_warnings = 0
+    for r in scanned:
+        counts = r.snapshot()
+        clean += not counts.with_errors
+        total_errors += counts.console_err + counts.http_404 + counts.http_4xx + counts.http_5xx
+        total_warnings += counts.console_warn
     avg_size = int(sum(r.page_size_bytes for r in scanned) / total)
 
     error_score = int(round(100 * clean / total))
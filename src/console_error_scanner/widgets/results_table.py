@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from collections.abc import Callable
 
@@ -91,6 +92,9 @@ class ResultsDataTable(DataTable):
 from ..i18n import t
 from ..models.scan_result import PageStatus, ScanResult, format_page_size
 
+# Zeilen pro Portion beim schrittweisen Befuellen (load_results_chunked).
+_FILL_CHUNK = 500
+
 
 class ResultsTable(Vertical):
     """Widget mit filterbarer + sortierbarer DataTable fuer Scan-Ergebnisse."""
@@ -170,6 +174,9 @@ class ResultsTable(Vertical):
         super().__init__(**kwargs)
         self._results: list[ScanResult] = []
         self._filtered: list[ScanResult] = []
+        # id(Ergebnis) -> Zeilenindex in _filtered; spart das lineare
+        # list.index() bei jedem Live-Update.
+        self._row_index: dict[int, int] = {}
         self._col_keys: list = []
         self._base_column_labels: list[str] = []
         self._show_only_errors: bool = False
@@ -182,6 +189,9 @@ class ResultsTable(Vertical):
         # Schwellwert fuer "zu grosse Seite" in Bytes (0 = aus). Wird von der
         # App aus den Settings gesetzt (set_size_warn_mb).
         self._size_warn_bytes: int = 0
+        # Wird bei jedem Neuaufbau erhoeht - ein laufendes schrittweises
+        # Befuellen erkennt daran, dass es ueberholt wurde.
+        self._fill_generation: int = 0
 
     def compose(self) -> ComposeResult:
         """Erstellt die Kind-Widgets."""
@@ -268,10 +278,32 @@ class ResultsTable(Vertical):
         self._auto_scroll_row = -1
         self._apply_filter()
 
+    def reset_rows(self, results: list[ScanResult]) -> None:
+        """Schreibt alle Zeilen in-place neu, ohne die DataTable neu aufzubauen.
+
+        Fuer Ergebnisse, die sich selbst geaendert haben (z.B. Reset auf
+        PENDING vor einem neuen Scan). Nur wenn die Tabelle eine andere Liste
+        zeigt oder Filter/Sortierung die Zeilen umordnen koennen, wird wie bei
+        load_results komplett neu aufgebaut.
+        """
+        if results is not self._results or self._show_only_errors or self.filter_text or self._sort_col is not None:
+            self.load_results(results)
+            return
+        self._auto_scroll = True
+        self._auto_scroll_row = -1
+        table = self.query_one("#results-data", DataTable)
+        if table.row_count != len(self._filtered):
+            self._apply_filter()
+            return
+        with self.app.batch_update():
+            for idx, result in enumerate(self._filtered):
+                self._update_row_cells(table, idx, result)
+
     def clear_results(self) -> None:
         """Leert die Ergebnisliste und die DataTable."""
         self._results = []
         self._filtered = []
+        self._row_index = {}
         self._auto_scroll = True
         self._auto_scroll_row = -1
         with contextlib.suppress(Exception):
@@ -293,9 +325,8 @@ class ResultsTable(Vertical):
             self._refresh_table()
             return
 
-        try:
-            idx = self._filtered.index(result)
-        except ValueError:
+        idx = self._row_index.get(id(result))
+        if idx is None:
             return
 
         table = self.query_one("#results-data", DataTable)
@@ -306,6 +337,24 @@ class ResultsTable(Vertical):
                 self._auto_scroll_row = idx
             table.move_cursor(row=self._auto_scroll_row)
 
+    def update_results(self, results: list[ScanResult]) -> None:
+        """Aktualisiert mehrere Ergebnisse auf einmal (gebuendelte Live-Updates).
+
+        Bei aktivem Filter / aktiver Sortierung genuegt EIN Rebuild fuer den
+        ganzen Stapel statt einem pro Ergebnis.
+        """
+        if not results:
+            return
+        if self._show_only_errors or self.filter_text or self._sort_col is not None:
+            self._rebuild_filtered()
+            if self._auto_scroll:
+                for result in results:
+                    self._scroll_to_result(result)
+            self._refresh_table()
+            return
+        for result in results:
+            self.update_result(result)
+
     def _update_row_cells(self, table: DataTable, idx: int, result: ScanResult) -> None:
         """Aktualisiert alle Zellen einer Zeile in-place."""
         row_key = str(idx)
@@ -355,12 +404,9 @@ class ResultsTable(Vertical):
 
     def _scroll_to_result(self, result: ScanResult) -> None:
         """Merkt sich die Ziel-Zeile fuer Auto-Scroll."""
-        try:
-            row = self._filtered.index(result)
-            if row >= self._auto_scroll_row:
-                self._auto_scroll_row = row
-        except ValueError:
-            pass
+        row = self._row_index.get(id(result))
+        if row is not None and row >= self._auto_scroll_row:
+            self._auto_scroll_row = row
 
     def _rebuild_filtered(self) -> None:
         """Baut die gefilterte und sortierte Liste neu auf."""
@@ -380,6 +426,7 @@ class ResultsTable(Vertical):
                 filtered.sort(key=key_func, reverse=self._sort_desc)
 
         self._filtered = filtered
+        self._row_index = {id(r): idx for idx, r in enumerate(filtered)}
 
     def _apply_filter(self) -> None:
         """Wendet den aktuellen Filter an und aktualisiert die Tabelle."""
@@ -390,9 +437,50 @@ class ResultsTable(Vertical):
         """Baut die DataTable komplett neu auf (clear + rebuild)."""
         table = self.query_one("#results-data", DataTable)
         saved_row = table.cursor_row
-        table.clear()
+        self._fill_generation += 1
+        # Ein Repaint fuer den ganzen Neuaufbau statt Zwischenstaende.
+        with self.app.batch_update():
+            table.clear()
+            self._add_rows(table, 0, len(self._filtered))
+            self._restore_cursor(table, saved_row)
+            self._update_count_label()
+
+    async def load_results_chunked(self, results: list[ScanResult]) -> None:
+        """Wie load_results, fuegt die Zeilen aber portionsweise ein.
+
+        Nach jeder Portion wird die Event-Loop freigegeben - bei sehr grossen
+        Sitemaps bleiben Eingaben und Animationen waehrend des Befuellens
+        bedienbar. Ein zwischenzeitlicher synchroner Neuaufbau (Filter,
+        Sortierung) bricht das Befuellen ab, er hat die Tabelle dann schon
+        vollstaendig gefuellt.
 
-        for idx, result in enumerate(self._filtered):
+        Args:
+            results:
+                Die anzuzeigenden Ergebnisse.
+        """
+        self._results = results
+        self._auto_scroll = True
+        self._auto_scroll_row = -1
+        self._rebuild_filtered()
+        table = self.query_one("#results-data", DataTable)
+        saved_row = table.cursor_row
+        self._fill_generation += 1
+        generation = self._fill_generation
+        table.clear()
+        self._update_count_label()
+        total = len(self._filtered)
+        for start in range(0, total, _FILL_CHUNK):
+            if start:
+                await asyncio.sleep(0)
+                if generation != self._fill_generation:
+                    return
+            self._add_rows(table, start, min(start + _FILL_CHUNK, total))
+        self._restore_cursor(table, saved_row)
+
+    def _add_rows(self, table: DataTable, start: int, stop: int) -> None:
+        """Haengt die Zeilen ``_filtered[start:stop]`` an die DataTable an."""
+        for idx in range(start, stop):
+            result = self._filtered[idx]
             status_text = self._styled_status(result)
             scanned = result.status not in (PageStatus.PENDING, PageStatus.SCANNING)
 
@@ -436,7 +524,8 @@ class ResultsTable(Vertical):
                 key=str(idx),
             )
 
-        # Cursor wiederherstellen
+    def _restore_cursor(self, table: DataTable, saved_row: int) -> None:
+        """Setzt den Cursor nach einem Neuaufbau (Auto-Scroll-Ziel oder alte Zeile)."""
         if self._auto_scroll and 0 <= self._auto_scroll_row < len(self._filtered):
             target_row = self._auto_scroll_row
         elif saved_row >= 0 and len(self._filtered) > 0:
@@ -447,6 +536,8 @@ class ResultsTable(Vertical):
         if target_row >= 0:
             table.move_cursor(row=target_row)
 
+    def _update_count_label(self) -> None:
+        """Aktualisiert die Zeile "N URLs" (bzw. "X von N") ueber der Tabelle."""
         count_label = self.query_one("#results-count", Static)
         total = len(self._results)
         shown = len(self._filtered)
@@ -84,6 +84,24 @@ def _shorten_url(url: str) -> str:
     return short
 
 
+def _fingerprint(result: ScanResult) -> tuple:
+    """Kurzer Stand eines Results fuer die Frage "muss neu gezeichnet werden?".
+
+    Die Fehlerliste waechst waehrend eines Scans nur - ihre Laenge genuegt.
+    Whitelist-Aenderungen laufen ueber refresh_view und zeichnen immer neu.
+    """
+    return (
+        result.status,
+        result.http_status_code,
+        len(result.errors),
+        result.load_time_ms,
+        result.page_size_bytes,
+        result.request_count,
+        result.retry_count,
+        len(result.response_headers),
+    )
+
+
 class StatsPanel(VerticalScroll):
     """Detail-Panel der markierten URL — analog sitemap-tracker.StatsPanel."""
 
@@ -109,6 +127,8 @@ class StatsPanel(VerticalScroll):
         # Pro-URL gemerkter Aufgeklappt-Zustand fuer das HTTP-Header-Panel,
         # damit der User-Toggle nicht beim naechsten Highlight zurueckspringt.
         self._headers_expanded: dict[str, bool] = {}
+        # Stand des zuletzt gezeichneten Results - siehe update_from_result.
+        self._fingerprint: tuple | None = None
 
     def on_click(self, event: Click) -> None:
         """Rechtsklick (Button 3) -> Whitelist-Kontextmenue anfordern.
@@ -346,6 +366,7 @@ class StatsPanel(VerticalScroll):
     def show_result(self, result: ScanResult) -> None:
         """Zeigt Detail-Infos zur markierten URL."""
         self._result = result
+        self._fingerprint = _fingerprint(result)
         panels: list = [self._page_panel(result)]
 
         headers_panel = self._http_headers_panel(result)
@@ -381,6 +402,17 @@ class StatsPanel(VerticalScroll):
         """Gibt das aktuell angezeigte Result zurueck (fuer copy_details)."""
         return self._result
 
+    def update_from_result(self, result: ScanResult) -> None:
+        """Live-Update waehrend des Scans: zeichnet nur neu, wenn sich am
+        angezeigten Result etwas Sichtbares geaendert hat.
+
+        Args:
+            result: Geaendertes Result; andere als das angezeigte werden ignoriert.
+        """
+        if result is not self._result or _fingerprint(result) == self._fingerprint:
+            return
+        self.show_result(result)
+
     def refresh_view(self) -> None:
         """Erneut zeichnen (z.B. nach Whitelist-Aenderung)."""
         if self._result is not None:
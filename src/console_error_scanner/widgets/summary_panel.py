@@ -14,7 +14,19 @@ from textual.widgets import Static
 from textual_widgets import InfoHeader, InfoItem
 
 from ..i18n import t
-from ..models.scan_result import PageStatus, ScanResult
+from ..models.scan_result import ResultCounts, ScanResult
+
+# Stil der Zaehler im Header, wenn sie > 0 sind (bei 0 immer "dim").
+_COUNT_STYLES: dict[str, str] = {
+    "with_errors": "bold red",
+    "console_err": "bold red",
+    "console_warn": "bold yellow",
+    "ignored": "dim",
+    "http_404": "bold yellow",
+    "http_4xx": "bold yellow",
+    "http_5xx": "bold red",
+    "timeouts": "bold yellow",
+}
 
 
 class SummaryHeader(InfoHeader):  # type: ignore[misc]
@@ -70,6 +82,11 @@ class SummaryHeader(InfoHeader):  # type: ignore[misc]
         self._whitelist_active = whitelist_active
         # Basis-Titel merken; der Score wird per set_score dahinter gehaengt.
         self._base_title: str = t("header.title")
+        # Laufende Summen + Beitrag je Ergebnis (id -> Zaehler), damit ein
+        # einzelnes neues Ergebnis nicht alle anderen neu zaehlen muss.
+        self._totals = ResultCounts()
+        self._snapshots: dict[int, ResultCounts] = {}
+        self._result_total: int = 0
 
     @staticmethod
     def _on_off_text(flag: bool) -> str:
@@ -107,6 +124,9 @@ class SummaryHeader(InfoHeader):  # type: ignore[misc]
         self.set_value("scanned", "0")
         self.set_value("duration", t("header.value_none"))
         self._reset_title()
+        self._totals = ResultCounts()
+        self._snapshots = {}
+        self._result_total = url_count
         for key in (
             "with_errors",
             "console_err",
@@ -139,38 +159,55 @@ class SummaryHeader(InfoHeader):  # type: ignore[misc]
         self._scroll_on = trigger_lazy_load
 
     def update_from_results(self, results: list[ScanResult], duration_text: str | None = None) -> None:
-        """Aktualisiert die Fehler- und Fortschrittsspalten aus aktuellen Ergebnissen.
+        """Zaehlt die Fehler- und Fortschrittsspalten komplett neu.
+
+        Fuer Live-Updates einzelner Ergebnisse gibt es update_results.
 
         Args:
             results: Aktuelle Scan-Ergebnisse.
             duration_text: Optional bereits formatierte Dauer (z.B. "12.3s").
         """
-        scanned = sum(
-            1 for r in results if r.status in (PageStatus.OK, PageStatus.WARNING, PageStatus.ERROR, PageStatus.TIMEOUT)
-        )
-        total = len(results)
-        with_errors = sum(1 for r in results if r.has_errors)
-        console_err = sum(r.console_error_count for r in results)
-        console_warn = sum(r.console_warning_count for r in results)
-        http_404 = sum(r.http_404_count for r in results)
-        http_4xx = sum(r.http_4xx_count for r in results)
-        http_5xx = sum(r.http_5xx_count for r in results)
-        timeouts = sum(1 for r in results if r.status == PageStatus.TIMEOUT)
-        ignored = sum(r.ignored_count for r in results)
-
-        self.set_value("scanned", f"{scanned}/{total}" if total else "0")
+        self._snapshots = {id(r): r.snapshot() for r in results}
+        totals = [0] * len(ResultCounts._fields)
+        for snapshot in self._snapshots.values():
+            for i, value in enumerate(snapshot):
+                totals[i] += value
+        self._totals = ResultCounts(*totals)
+        self._result_total = len(results)
         if duration_text is not None:
             self.set_value("duration", duration_text)
+        self._show_counts(ResultCounts._fields)
 
-        self.set_value("with_errors", str(with_errors), value_style="bold red" if with_errors else "dim")
-        self.set_value("console_err", str(console_err), value_style="bold red" if console_err else "dim")
-        self.set_value(
-            "console_warn",
-            str(console_warn),
-            value_style="bold yellow" if console_warn else "dim",
-        )
-        self.set_value("ignored", str(ignored), value_style="dim")
-        self.set_value("http_404", str(http_404), value_style="bold yellow" if http_404 else "dim")
-        self.set_value("http_4xx", str(http_4xx), value_style="bold yellow" if http_4xx else "dim")
-        self.set_value("http_5xx", str(http_5xx), value_style="bold red" if http_5xx else "dim")
-        self.set_value("timeouts", str(timeouts), value_style="bold yellow" if timeouts else "dim")
+    def update_results(self, results: list[ScanResult]) -> None:
+        """Fuehrt die Zaehler fuer geaenderte Ergebnisse inkrementell nach.
+
+        Pro Ergebnis wird nur dessen alter Beitrag gegen den neuen getauscht -
+        O(1) statt eines Durchlaufs ueber alle Ergebnisse. Neu gesetzt werden
+        nur die Werte, die sich tatsaechlich geaendert haben.
+
+        Args:
+            results: Seit dem letzten Aufruf geaenderte Ergebnisse. Sie muessen
+                zu der Liste gehoeren, die zuletzt an update_from_results ging.
+        """
+        totals = list(self._totals)
+        for result in results:
+            new = result.snapshot()
+            old = self._snapshots.get(id(result), ResultCounts())
+            self._snapshots[id(result)] = new
+            for i, (before, after) in enumerate(zip(old, new, strict=True)):
+                totals[i] += after - before
+        updated = ResultCounts(*totals)
+        changed = [name for name, a, b in zip(ResultCounts._fields, self._totals, updated, strict=True) if a != b]
+        self._totals = updated
+        self._show_counts(changed)
+
+    def _show_counts(self, names: list[str] | tuple[str, ...]) -> None:
+        """Schreibt die genannten Zaehler aus self._totals in den Header."""
+        totals = self._totals._asdict()
+        for name in names:
+            value = totals[name]
+            if name == "scanned":
+                total = self._result_total
+                self.set_value("scanned", f"{value}/{total}" if total else "0")
+            else:
+                self.set_value(name, str(value), value_style=_COUNT_STYLES[name] if value else "dim")
@@ -0,0 +1,123 @@
+"""Tests fuer das Kommandozeilen-Parsing in ``_cli``.
+
+Der Parser ist eine eigene Schleife statt argparse. Diese Tests halten fest,
+dass er dieselben Schreibweisen versteht und dieselben Fehler meldet - ein
+stilles Verschlucken einer Option waere schlimmer als ein Abbruch.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from console_error_scanner import __version__
+from console_error_scanner._cli import OPTIONS, answer_without_parser, help_text, parse_args
+
+
+def test_ohne_argumente_gelten_die_defaults() -> None:
+    args = parse_args([], default_lang="de")
+    assert args.sitemap_url == ""
+    assert args.concurrency is None
+    assert args.timeout is None
+    assert args.cookie == []
+    assert args.lang == "de"
+    # Nicht angegeben = None, damit die App den Settings-Wert nimmt.
+    assert args.no_consent is None
+    assert args.no_scroll is None
+    assert args.ignore_robots is None
+    assert args.no_headless is False
+
+
+def test_unbekannte_sprache_aus_den_settings_blockiert_den_start_nicht() -> None:
+    """Nur ein angegebenes --lang wird geprueft - der Settings-Wert faellt spaeter zurueck."""
+    assert parse_args([], default_lang="fr").lang == "fr"
+    assert parse_args(["--lang", "en"], default_lang="fr").lang == "en"
+
+
+def test_alle_schreibweisen_einer_option() -> None:
+    assert parse_args(["--concurrency", "4"], "de").concurrency == 4
+    assert parse_args(["--concurrency=4"], "de").concurrency == 4
+    assert parse_args(["-c", "4"], "de").concurrency == 4
+    assert parse_args(["-c4"], "de").concurrency == 4
+
+
+def test_eindeutige_abkuerzungen_wie_argparse() -> None:
+    assert parse_args(["--conc", "4"], "de").concurrency == 4
+    assert parse_args(["--conc=4"], "de").concurrency == 4
+    assert parse_args(["--no-s"], "de").no_scroll is True
+    assert parse_args(["--output-j", "r.json"], "de").output_json == "r.json"
+
+
+def test_mehrdeutige_abkuerzung_endet_mit_exit_2(capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        parse_args(["--no"], default_lang="de")
+    assert exc.value.code == 2
+    assert "ambiguous option: --no could match --no-headless, --no-consent, --no-scroll" in capsys.readouterr().err
+
+
+def test_url_und_optionen_gemischt() -> None:
+    args = parse_args(
+        ["https://example.com", "-t", "30", "--no-consent", "--filter", "/blog", "--lang", "en"],
+        default_lang="de",
+    )
+    assert args.sitemap_url == "https://example.com"
+    assert args.timeout == 30
+    assert args.no_consent is True
+    assert args.filter == "/blog"
+    assert args.lang == "en"
+
+
+def test_cookie_ist_mehrfach_moeglich() -> None:
+    args = parse_args(["--cookie", "a=1", "--cookie=b=2"], default_lang="de")
+    assert args.cookie == ["a=1", "b=2"]
+
+
+@pytest.mark.parametrize("level", ["error", "warn", "all"])
+def test_console_level_akzeptiert_jede_stufe(level: str) -> None:
+    assert parse_args(["--console-level", level], "de").console_level == level
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["--concurrency", "viele"],
+        ["--console-level", "debug"],
+        ["--lang", "fr"],
+        ["--unbekannt"],
+        ["--timeout"],
+        ["--filter", "--no-scroll"],
+        ["--no-scroll=ja"],
+        ["https://a.example", "https://b.example"],
+    ],
+)
+def test_fehlerhafte_aufrufe_enden_mit_exit_2(argv: list[str], capsys: pytest.CaptureFixture[str]) -> None:
+    with pytest.raises(SystemExit) as exc:
+        parse_args(argv, default_lang="de")
+    assert exc.value.code == 2
+    assert "error:" in capsys.readouterr().err
+
+
+def test_hilfe_nennt_jede_option() -> None:
+    """Die Hilfe ist vorformatiert - sie darf keiner Option hinterherhinken."""
+    for option in OPTIONS:
+        assert option in help_text(), option
+
+
+def test_hilfe_und_version_ohne_parser(capsys: pytest.CaptureFixture[str]) -> None:
+    assert answer_without_parser(["--help"]) is True
+    assert capsys.readouterr().out == help_text()
+    assert answer_without_parser(["--version"]) is True
+    assert capsys.readouterr().out == f"console-error-scanner {__version__}\n"
+    assert answer_without_parser(["--vers"]) is True
+    assert capsys.readouterr().out == f"console-error-scanner {__version__}\n"
+    assert answer_without_parser(["https://example.com"]) is False
+
+
+@pytest.mark.parametrize("argv", [["--filter", "-h"], ["-f", "--help"], ["--", "-h"], ["--conc", "--version"]])
+def test_hilfe_als_wert_oder_nach_doppelstrich_ist_keine_anfrage(argv: list[str]) -> None:
+    assert answer_without_parser(argv) is False
+
+
+def test_hilfe_nach_einem_optionswert(capsys: pytest.CaptureFixture[str]) -> None:
+    assert answer_without_parser(["--filter", "shop", "-h"]) is True
+    assert answer_without_parser(["--filter=-x", "--no-scroll", "-h"]) is True
+    assert capsys.readouterr().out == help_text() * 2
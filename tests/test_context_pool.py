@@ -0,0 +1,131 @@
+"""Tests fuer den Pool der Browser-Kontexte im Scanner.
+
+Pro URL einen neuen Kontext anzulegen kostet spuerbar Zeit. Der Scanner gibt
+einen Kontext nach einer sauber gescannten Seite zurueck in den Pool - aber nur
+dann: nach Fehler, Abbruch oder Browser-Recovery darf er nicht wieder auftauchen.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from console_error_scanner.services.scanner import Scanner, _origin
+
+
+class _FakeContext:
+    def __init__(self, browser: object) -> None:
+        self.browser = browser
+        self.closed = False
+        self.cookies_cleared = 0
+
+    async def clear_cookies(self) -> None:
+        if self.closed:
+            raise RuntimeError("Target closed")
+        self.cookies_cleared += 1
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.created: list[_FakeContext] = []
+
+    async def new_context(self, **kwargs: object) -> _FakeContext:
+        context = _FakeContext(self)
+        self.created.append(context)
+        return context
+
+
+def _scanner(browser: _FakeBrowser) -> Scanner:
+    scanner = Scanner()
+    scanner._browser = browser  # type: ignore[assignment]
+    return scanner
+
+
+def test_clean_page_returns_its_context_for_reuse() -> None:
+    browser = _FakeBrowser()
+    scanner = _scanner(browser)
+
+    async def run() -> None:
+        first = await scanner._acquire_context()
+        page = _FakePage()
+        await scanner._release_context(first, page, reusable=True)  # type: ignore[arg-type]
+        assert page.closed and not first.closed
+        assert await scanner._acquire_context() is first
+
+    asyncio.run(run())
+    assert len(browser.created) == 1
+    assert browser.created[0].cookies_cleared == 1
+
+
+def test_failed_or_cancelled_page_closes_its_context() -> None:
+    browser = _FakeBrowser()
+    scanner = _scanner(browser)
+
+    async def run() -> None:
+        failed = await scanner._acquire_context()
+        await scanner._release_context(failed, _FakePage(), reusable=False)  # type: ignore[arg-type]
+        assert failed.closed
+
+        scanner._cancelled = True
+        cancelled = await scanner._acquire_context()
+        await scanner._release_context(cancelled, _FakePage(), reusable=True)  # type: ignore[arg-type]
+        assert cancelled.closed
+
+    asyncio.run(run())
+    assert scanner._idle_contexts == []
+
+
+def test_contexts_of_a_replaced_browser_are_dropped() -> None:
+    old_browser = _FakeBrowser()
+    scanner = _scanner(old_browser)
+
+    async def run() -> None:
+        stale = await scanner._acquire_context()
+        await scanner._release_context(stale, _FakePage(), reusable=True)  # type: ignore[arg-type]
+        scanner._browser = _FakeBrowser()  # type: ignore[assignment]  # Browser-Recovery
+        fresh = await scanner._acquire_context()
+        assert fresh is not stale
+        assert stale.closed
+
+    asyncio.run(run())
+
+
+class _FakeCdp:
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.sent: list[tuple[str, dict | None]] = []
+
+    async def send(self, method: str, params: dict | None = None) -> None:
+        if self.fail:
+            raise RuntimeError("Target closed")
+        self.sent.append((method, params))
+
+
+def test_storage_of_every_touched_origin_is_cleared() -> None:
+    """Auch Drittanbieter (Consent-Manager, Widgets) duerfen nichts in die naechste Seite tragen."""
+    cdp = _FakeCdp()
+    origins = {"https://ex.com", "https://consent.example", ""}
+    assert asyncio.run(Scanner._clear_site_data(cdp, origins)) is True  # type: ignore[arg-type]
+    assert cdp.sent[0] == ("Network.clearBrowserCache", None)
+    cleared = {params["origin"] for method, params in cdp.sent if method == "Storage.clearDataForOrigin"}
+    assert cleared == {"https://ex.com", "https://consent.example"}
+
+
+def test_context_is_not_reused_when_clearing_fails() -> None:
+    assert asyncio.run(Scanner._clear_site_data(_FakeCdp(fail=True), {"https://ex.com"})) is False  # type: ignore[arg-type]
+
+
+def test_origin_of_request_urls() -> None:
+    assert _origin("https://ex.com/a/b?c") == "https://ex.com"
+    assert _origin("http://ex.com:8080?x") == "http://ex.com:8080"
+    assert _origin("data:text/plain,x") == ""
@@ -0,0 +1,81 @@
+"""Tests fuer das Speichern und Laden der Scan-History."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from console_error_scanner.models.history import History, HistoryEntry
+
+
+@pytest.fixture
+def history_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "history.json"
+    monkeypatch.setattr(History, "HISTORY_DIR", tmp_path)
+    monkeypatch.setattr(History, "HISTORY_FILE", path)
+    return path
+
+
+def test_save_and_load_roundtrip(history_file: Path) -> None:
+    entries = [
+        HistoryEntry(sitemap_url="https://ex.com/sitemap.xml", timestamp="2026-01-01T10:00:00", user="äöü"),
+        HistoryEntry(sitemap_url="https://ex.org/sitemap.xml", cookies=[{"name": "a", "value": "1"}]),
+    ]
+    History.save(entries)
+    assert History.load() == entries
+    # Die temporaere Datei wurde ersetzt, nicht liegen gelassen.
+    assert [p.name for p in history_file.parent.iterdir()] == ["history.json"]
+
+
+def test_save_replaces_an_existing_file(history_file: Path) -> None:
+    History.save([HistoryEntry(sitemap_url="https://alt.example/")])
+    History.save([HistoryEntry(sitemap_url="https://neu.example/")])
+    assert [e.sitemap_url for e in History.load()] == ["https://neu.example/"]
+
+
+def test_broken_file_yields_empty_history(history_file: Path) -> None:
+    history_file.write_text("{kein json", encoding="utf-8")
+    assert History.load() == []
+
+
+def test_add_reuses_the_cache_and_notices_external_changes(history_file: Path) -> None:
+    History.add(HistoryEntry(sitemap_url="https://eins.example/"))
+    History.add(HistoryEntry(sitemap_url="https://zwei.example/"))
+    assert [e.sitemap_url for e in History.load()] == ["https://zwei.example/", "https://eins.example/"]
+
+    # Von aussen ueberschrieben (anderer Inhalt, andere Groesse) -> neu lesen.
+    history_file.write_text('[{"sitemap_url": "https://extern.example/sitemap.xml"}]', encoding="utf-8")
+    assert [e.sitemap_url for e in History.load()] == ["https://extern.example/sitemap.xml"]
+
+
+def test_from_dict_fills_missing_fields_with_defaults() -> None:
+    first = HistoryEntry.from_dict({"sitemap_url": "https://ex.com/"})
+    second = HistoryEntry.from_dict({})
+    assert first == HistoryEntry(sitemap_url="https://ex.com/")
+    assert second.sitemap_url == ""
+    # Jeder Eintrag bekommt eine eigene Cookie-Liste.
+    assert first.cookies is not second.cookies
+    assert HistoryEntry.from_dict(first.to_dict()) == first
+
+
+def test_display_label_lists_host_and_non_default_options() -> None:
+    entry = HistoryEntry(
+        sitemap_url="https://www.example.com/sitemap.xml",
+        timestamp="2026-02-13T14:30:12",
+        cookies=[{"name": "sid", "value": "1"}],
+        accept_consent=False,
+    )
+    assert entry.display_label() == "2026-02-13 14:30 | www.example.com | --cookie sid | --no-consent"
+    assert HistoryEntry(sitemap_url="sitemap.xml").display_label() == "? | sitemap.xml"
+    assert entry.display_timestamp == "2026-02-13 14:30"
+    assert entry.display_host == "www.example.com"
+    assert HistoryEntry(sitemap_url="sitemap.xml").display_host == "sitemap.xml"
+
+
+def test_add_stamps_entries_in_the_stored_format(history_file: Path) -> None:
+    History.add(HistoryEntry(sitemap_url="https://ex.com/", user="tester"))
+    stamp = History.load()[0].timestamp
+    # YYYY-MM-DDTHH:MM:SS - ohne Sekundenbruchteile, die display_label abschneidet.
+    assert len(stamp) == 19
+    assert stamp[10] == "T"
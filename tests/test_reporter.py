@@ -1,8 +1,9 @@
-"""Tests fuer JIRA-Tabellen-, JSON- und Text-Export."""
+"""Tests fuer JIRA-Tabellen-, JSON-, Text- und HTML-Export."""
 
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
 import pytest
 
@@ -110,3 +111,38 @@ def test_build_json_is_parseable_with_results() -> None:
     assert len(data["results"]) == 1
     assert data["results"][0]["url"] == "https://ex.com/tot"
     assert "site_score" in data
+
+
+def test_html_rows_escape_and_split_active_and_ignored(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    page = _err_page("https://ex.com/?a=1&b=<x>", message="Fehler <b>'boom'</b>")
+    page.errors.append(PageError(error_type=ErrorType.CONSOLE_WARNING, message="bekannt & egal", whitelisted=True))
+    summary = ScanSummary.from_results("https://ex.com", [page])
+    html = Path(Reporter.save_html([page], summary, str(tmp_path / "r.html"))).read_text(encoding="utf-8")
+
+    assert "<a href='https://ex.com/?a=1&amp;b=&lt;x&gt;' target='_blank'>" in html
+    assert (
+        "<li><span class='error-type console_error'>Console</span> "
+        "Fehler &lt;b&gt;&#x27;boom&#x27;&lt;/b&gt; <span class='source'>(app.js:42)</span></li>"
+    ) in html
+    assert "<li><span class='error-type ignored'>Warning</span> bekannt &amp; egal</li>" in html
+    assert "<tr class='error'>" in html
+    # Zaehler-Kacheln: rot bei Fehlern, gruen bei null.
+    assert '<div class="label">Console Errors</div>\n            <div class="value error">1</div>' in html
+    assert '<div class="label">HTTP 5xx</div>\n            <div class="value ok">0</div>' in html
+    assert '<div class="summary-card ignored-card">' in html
+
+
+@pytest.mark.parametrize("count", [0, 1, 3])
+def test_json_stream_matches_json_dumps(count: int, tmp_path) -> None:  # type: ignore[no-untyped-def]
+    """Der seitenweise geschriebene Report ist byte-gleich zu json.dumps."""
+    pages = [_err_page(f"https://ex.com/{i}", message="Zeile 1\nZeile 2 äöü") for i in range(count)]
+    summary = ScanSummary.from_results("https://ex.com", pages)
+    streamed = Reporter.build_json(pages, summary)
+
+    report = json.loads(streamed)
+    assert streamed == json.dumps(report, indent=2, ensure_ascii=False)
+    assert list(report) == ["generated_at", "summary", "site_score", "results"]
+    assert len(report["results"]) == count
+
+    saved = Path(Reporter.save_json(pages, summary, str(tmp_path / "r.json")))
+    assert json.loads(saved.read_text(encoding="utf-8"))["results"] == report["results"]
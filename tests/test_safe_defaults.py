@@ -10,7 +10,7 @@ from __future__ import annotations
 import locale
 
 from console_error_scanner.i18n import detect_language
-from console_error_scanner.models.settings import Settings
+from console_error_scanner.models.settings import Settings, parse_cookies
 from console_error_scanner.services.rate_limit import RateLimiter
 from console_error_scanner.services.scanner import Scanner
 
@@ -40,6 +40,18 @@ class TestSafeDefaults:
         assert data["rate_limit_enabled"] is False
 
 
+class TestCookieParsing:
+    def test_separators_and_whitespace(self) -> None:
+        assert parse_cookies("a=1; b = 2 ,c=3=4") == [
+            {"name": "a", "value": "1"},
+            {"name": "b", "value": "2"},
+            {"name": "c", "value": "3=4"},
+        ]
+
+    def test_entries_without_name_or_equals_are_skipped(self) -> None:
+        assert parse_cookies("noeq; =x;  ") == []
+
+
 class TestLanguageDetection:
     def test_german_environment(self, monkeypatch) -> None:  # type: ignore[no-untyped-def]
         monkeypatch.setattr(locale, "getlocale", lambda *a: ("de_DE", "UTF-8"))
@@ -73,3 +73,38 @@ class TestScanRateLimit:
         # Untere Schranke mit Abstand zum Sollwert (200 ms): die Timeraufloesung
         # unter Windows liegt bei rund 15 ms, ein exakter Wert waere flaky.
         assert _scan_seconds(1200, monkeypatch) >= 0.15
+
+
+def test_each_result_is_reported_as_soon_as_its_page_is_done(monkeypatch) -> None:  # type: ignore[no-untyped-def]
+    """Die Live-Anzeige darf nicht auf die langsamste Seite warten.
+
+    Jede Aufgabe meldet ihr Ergebnis selbst - gather() sammelt nur noch ein.
+    Die schnelle Seite muss fertig gemeldet sein, waehrend die langsame noch laeuft.
+    """
+    monkeypatch.setattr(scanner_module, "async_playwright", lambda: _FakePlaywright())
+    scanner = Scanner(concurrency=2, timeout=5, rate_per_minute=0)
+    slow_release = asyncio.Event()
+    reported_while_slow_pending: list[int] = []
+
+    async def fake_launch() -> object:
+        return object()
+
+    async def fake_scan_single(result: ScanResult, log: object) -> None:
+        if result.url.endswith("langsam"):
+            await slow_release.wait()
+
+    async def fake_close() -> None:
+        return None
+
+    def on_progress(current: int, total: int) -> None:
+        if not slow_release.is_set():
+            reported_while_slow_pending.append(current)
+            slow_release.set()
+
+    monkeypatch.setattr(scanner, "_launch_browser", fake_launch)
+    monkeypatch.setattr(scanner, "_scan_single_page", fake_scan_single)
+    monkeypatch.setattr(scanner, "_cleanup", fake_close)
+
+    results = [ScanResult(url="https://example.com/langsam"), ScanResult(url="https://example.com/schnell")]
+    asyncio.run(scanner.scan_urls(results, on_progress=on_progress))
+    assert reported_while_slow_pending == [1]
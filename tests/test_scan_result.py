@@ -0,0 +1,149 @@
+"""Tests fuer die Zaehler von ScanResult.
+
+Der Summary-Header fuehrt seine Summen ueber ``snapshot()`` inkrementell nach.
+Weicht der Snapshot von den Einzel-Properties ab, zeigt der Header waehrend
+des Scans andere Zahlen als nach dem Scan - das halten diese Tests fest.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from console_error_scanner.models.scan_result import (
+    ErrorType,
+    PageError,
+    PageStatus,
+    ResourceSize,
+    ResultCounts,
+    ScanResult,
+    ScanSummary,
+)
+
+
+def _result(status: PageStatus, *errors: tuple[ErrorType, bool]) -> ScanResult:
+    return ScanResult(
+        url="https://ex.com/",
+        status=status,
+        errors=[PageError(error_type=et, message="x", whitelisted=wl) for et, wl in errors],
+    )
+
+
+def test_pending_result_contributes_nothing() -> None:
+    assert ScanResult(url="https://ex.com/").snapshot() == ResultCounts()
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        _result(PageStatus.OK),
+        _result(PageStatus.TIMEOUT),
+        _result(
+            PageStatus.ERROR,
+            (ErrorType.CONSOLE_ERROR, False),
+            (ErrorType.CONSOLE_ERROR, True),
+            (ErrorType.CONSOLE_WARNING, False),
+            (ErrorType.HTTP_404, False),
+            (ErrorType.HTTP_4XX, False),
+            (ErrorType.HTTP_5XX, True),
+        ),
+        _result(PageStatus.WARNING, (ErrorType.CONSOLE_WARNING, False)),
+        _result(PageStatus.OK, (ErrorType.HTTP_5XX, True)),
+    ],
+)
+def test_snapshot_matches_the_single_properties(result: ScanResult) -> None:
+    snap = result.snapshot()
+    assert snap.scanned == 1
+    assert snap.with_errors == int(result.has_errors)
+    assert snap.console_err == result.console_error_count
+    assert snap.console_warn == result.console_warning_count
+    assert snap.ignored == result.ignored_count
+    assert snap.http_404 == result.http_404_count
+    assert snap.http_4xx == result.http_4xx_count
+    assert snap.http_5xx == result.http_5xx_count
+    assert snap.timeouts == int(result.status is PageStatus.TIMEOUT)
+
+
+def test_reset_restores_a_fresh_result() -> None:
+    result = _result(PageStatus.ERROR, (ErrorType.CONSOLE_ERROR, False))
+    result.http_status_code = 500
+    result.load_time_ms = result.dom_content_loaded_ms = result.request_count = 7
+    result.page_size_bytes = result.retry_count = 3
+    result.response_headers["server"] = "x"
+    result.content_type = "text/html"
+    result.last_modified = "gestern"
+    result.resource_sizes.append(ResourceSize(url="https://ex.com/a.js", size_bytes=1))
+    result.reset()
+    assert result == ScanResult(url="https://ex.com/")
+    # Frische Listen/Dicts je Reset - nicht die Default-Objekte teilen.
+    result.errors.append(PageError(error_type=ErrorType.CONSOLE_ERROR, message="x"))
+    assert ScanResult(url="https://ex.com/").errors == []
+
+
+def test_summary_counts_match_the_single_properties() -> None:
+    results = [
+        _result(PageStatus.OK),
+        _result(PageStatus.TIMEOUT),
+        _result(PageStatus.PENDING),
+        _result(
+            PageStatus.ERROR,
+            (ErrorType.CONSOLE_ERROR, False),
+            (ErrorType.CONSOLE_WARNING, False),
+            (ErrorType.HTTP_404, True),
+            (ErrorType.HTTP_4XX, False),
+            (ErrorType.HTTP_5XX, False),
+        ),
+        _result(PageStatus.WARNING, (ErrorType.CONSOLE_WARNING, False), (ErrorType.CONSOLE_ERROR, True)),
+    ]
+    summary = ScanSummary.from_results("https://ex.com/sitemap.xml", results, duration_ms=1234)
+    assert summary.total_urls == 5
+    assert summary.scanned_urls == 3  # ohne Timeout und Pending
+    assert summary.total_timeouts == 1
+    assert summary.urls_with_errors == sum(r.has_errors for r in results)
+    assert summary.total_console_errors == sum(r.console_error_count for r in results)
+    assert summary.total_console_warnings == sum(r.console_warning_count for r in results)
+    assert summary.total_http_404 == sum(r.http_404_count for r in results)
+    assert summary.total_http_4xx == sum(r.http_4xx_count for r in results)
+    assert summary.total_http_5xx == sum(r.http_5xx_count for r in results)
+    assert summary.total_ignored == sum(r.ignored_count for r in results)
+    assert summary.scan_duration_ms == 1234
+
+
+def test_to_dict_counts_match_the_single_properties() -> None:
+    result = _result(
+        PageStatus.ERROR,
+        (ErrorType.CONSOLE_ERROR, False),
+        (ErrorType.CONSOLE_ERROR, True),
+        (ErrorType.CONSOLE_WARNING, False),
+        (ErrorType.HTTP_404, False),
+        (ErrorType.HTTP_5XX, False),
+    )
+    data = result.to_dict()
+    assert data["total_errors"] == result.total_error_count == 4
+    assert data["console_errors"] == result.console_error_count
+    assert data["console_warnings"] == result.console_warning_count
+    assert data["http_404_errors"] == result.http_404_count
+    assert data["http_4xx_errors"] == result.http_4xx_count
+    assert data["http_5xx_errors"] == result.http_5xx_count
+    assert data["ignored_count"] == result.ignored_count == 1
+    assert len(data["errors"]) == 4
+    assert len(data["ignored_errors"]) == 1
+    # Enum-Werte landen als reine Strings im Export.
+    assert data["status"] == "error"
+    assert [e["error_type"] for e in data["ignored_errors"]] == ["console_error"]
+    assert type(data["status"]) is str
+
+
+def test_copy_is_independent_of_later_changes() -> None:
+    """Reports werden im Thread aus einer Kopie geschrieben - Live-Aenderungen bleiben draussen."""
+    result = _result(PageStatus.ERROR, (ErrorType.CONSOLE_ERROR, False))
+    result.response_headers["server"] = "x"
+    result.resource_sizes.append(ResourceSize(url="https://ex.com/a.js", size_bytes=1))
+    copy = result.copy()
+    assert copy == result
+
+    result.errors[0].whitelisted = True  # Whitelist umgeschaltet
+    result.reset()  # neuer Scan
+    assert copy.console_error_count == 1
+    assert copy.response_headers == {"server": "x"}
+    assert len(copy.resource_sizes) == 1
+    assert copy.status is PageStatus.ERROR
@@ -0,0 +1,202 @@
+"""Tests fuer das Auslesen der Sitemap-XML (ohne Netz)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from console_error_scanner.i18n import load_locale
+from console_error_scanner.models import sitemap as sitemap_module
+from console_error_scanner.models.sitemap import (
+    SitemapError,
+    SitemapParser,
+    _parse_robots_sitemaps,
+    discover_sitemap,
+    is_local_file,
+    is_sitemap_url,
+)
+
+
+@pytest.fixture(autouse=True)
+def _german_locale() -> None:
+    load_locale("de")
+
+
+def _parse(xml: str | bytes) -> list[str]:
+    return SitemapParser("https://ex.com/sitemap.xml")._parse_xml(xml)
+
+
+def test_urlset_with_namespace() -> None:
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc> https://ex.com/a </loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://ex.com/b(1)</loc></url>
+  <url><lastmod>2024-01-01</lastmod></url>
+</urlset>"""
+    # Klammern werden fuer klickbare Terminal-Links kodiert.
+    assert _parse(xml) == ["https://ex.com/a", "https://ex.com/b%281%29"]
+
+
+def test_raw_bytes_use_the_declared_encoding() -> None:
+    xml = """<?xml version="1.0" encoding="ISO-8859-1"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://ex.com/\u00fcber-uns</loc></url>
+</urlset>""".encode("latin-1")
+    assert _parse(xml) == ["https://ex.com/\u00fcber-uns"]
+
+
+def _fetch(content: bytes, content_type: str) -> list[str]:
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, content=content, headers={"Content-Type": content_type})
+    )
+
+    async def scenario() -> list[str]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await SitemapParser("https://ex.com/sitemap.xml", client=client).parse()
+
+    return asyncio.run(scenario())
+
+
+def test_charset_only_in_the_header_is_honoured() -> None:
+    """Latin-1 ohne Deklaration im Dokument: nur der Header kennt das Encoding."""
+    xml = """<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://ex.com/\u00fcber-uns</loc></url>
+</urlset>""".encode("latin-1")
+    assert _fetch(xml, "text/xml; charset=iso-8859-1") == ["https://ex.com/\u00fcber-uns"]
+
+
+@pytest.mark.parametrize("content_type", ["text/xml", "text/xml; charset=utf-8", "application/xml; charset=UTF8"])
+def test_utf8_responses_keep_working(content_type: str) -> None:
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://ex.com/\u00fcber-uns</loc></url>
+</urlset>""".encode()
+    assert _fetch(xml, content_type) == ["https://ex.com/\u00fcber-uns"]
+
+
+def test_sitemap_index_returns_the_sub_sitemaps() -> None:
+    xml = """<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://ex.com/s1.xml</loc></sitemap>
+  <sitemap><loc>https://ex.com/s2.xml</loc></sitemap>
+</sitemapindex>"""
+    assert _parse(xml) == ["https://ex.com/s1.xml", "https://ex.com/s2.xml"]
+
+
+def test_without_namespace() -> None:
+    xml = "<urlset><url><loc>https://ex.com/a</loc></url><sitemap><loc>https://ex.com/s.xml</loc></sitemap></urlset>"
+    assert _parse(xml) == ["https://ex.com/a", "https://ex.com/s.xml"]
+
+
+def test_only_direct_children_of_the_root_count() -> None:
+    xml = "<urlset><group><url><loc>https://ex.com/tief</loc></url></group></urlset>"
+    assert _parse(xml) == []
+
+
+def test_broken_xml_raises_sitemap_error() -> None:
+    with pytest.raises(SitemapError):
+        _parse("<urlset><url><loc>https://ex.com/a</loc></url>")
+
+
+def test_robots_sitemap_lines() -> None:
+    robots = (
+        "User-agent: *\r\n"
+        "Sitemap: https://ex.com/a.xml\r\n"
+        "  SITEMAP:https://ex.com/b.xml  \r\n"
+        "# Sitemap: https://ex.com/kommentar.xml\r\n"
+        "Sitemap:\r\n"
+        "Disallow: /privat\r\n"
+    )
+    # Die leere Sitemap-Zeile darf nicht die Folgezeile als URL liefern.
+    assert _parse_robots_sitemaps(robots) == ["https://ex.com/a.xml", "https://ex.com/b.xml"]
+
+
+def test_robots_lines_ending_in_a_bare_cr() -> None:
+    """RFC 9309 erlaubt auch ein einzelnes CR als Zeilenende."""
+    robots = "Sitemap: https://ex.com/x.xml\rUser-agent: *\rSitemap: https://ex.com/y.xml"
+    assert _parse_robots_sitemaps(robots) == ["https://ex.com/x.xml", "https://ex.com/y.xml"]
+
+
+def test_retries_reuse_the_injected_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Alle Versuche laufen ueber denselben Client - kein neuer Verbindungsaufbau."""
+    statuses = iter([503, 200])
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(next(statuses), content=b"<urlset><url><loc>https://ex.com/a</loc></url></urlset>")
+
+    async def no_wait(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(sitemap_module.asyncio, "sleep", no_wait)
+
+    async def scenario() -> list[str]:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            return await SitemapParser("https://ex.com/sitemap.xml", client=client).parse()
+
+    assert asyncio.run(scenario()) == ["https://ex.com/a"]
+    assert seen == ["https://ex.com/sitemap.xml"] * 2
+
+
+def test_fetch_gives_up_after_the_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_wait(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(sitemap_module.asyncio, "sleep", no_wait)
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+    async def scenario() -> list[str]:
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await SitemapParser("https://ex.com/sitemap.xml", client=client).parse()
+
+    with pytest.raises(SitemapError):
+        asyncio.run(scenario())
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://ex.com/sitemap.xml", True),
+        ("https://ex.com/SITEMAP.XML?x=1", True),
+        ("https://ex.com/", False),
+        ("https://ex.com/xml", False),
+    ],
+)
+def test_is_sitemap_url(url: str, expected: bool) -> None:
+    assert is_sitemap_url(url) is expected
+
+
+def test_urls_are_never_local_files(tmp_path) -> None:  # type: ignore[no-untyped-def]
+    datei = tmp_path / "sitemap.xml"
+    datei.write_text("<urlset/>", encoding="utf-8")
+    assert is_local_file(str(datei))
+    assert not is_local_file("HTTPS://ex.com/sitemap.xml")
+    assert not is_local_file(str(tmp_path / "fehlt.xml"))
+
+
+def test_discovery_keeps_the_path_priority(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Die Pfade werden parallel geprueft - gewinnen muss trotzdem der erste gueltige."""
+    valid = {"/sitemap_index.xml": 0.05, "/sitemap/sitemap.xml": 0.0}
+    requested: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        delay = valid.get(request.url.path)
+        if delay is None:
+            return httpx.Response(404)
+        await asyncio.sleep(delay)
+        return httpx.Response(200, headers={"content-type": "application/xml"})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        sitemap_module.httpx,
+        "AsyncClient",
+        lambda **kwargs: real_client(**kwargs, transport=httpx.MockTransport(handler)),
+    )
+
+    found = asyncio.run(discover_sitemap("https://ex.com/irgendwo"))
+    # Der langsamere, aber hoeher priorisierte Kandidat gewinnt.
+    assert found == "https://ex.com/sitemap_index.xml"
+    assert "/sitemap/index.xml" in requested
@@ -0,0 +1,80 @@
+"""Tests fuer das Whitelist-Matching.
+
+Die Patterns werden zu einem einzigen Regex zusammengefasst. Das Ergebnis muss
+exakt dem bisherigen fnmatch-Verhalten (case-insensitive) entsprechen - auch
+nachdem Patterns hinzugefuegt, entfernt oder direkt ersetzt wurden.
+"""
+
+from __future__ import annotations
+
+from fnmatch import fnmatch
+
+import pytest
+
+from console_error_scanner.models.scan_result import ErrorType, PageError, ScanResult
+from console_error_scanner.models.whitelist import Whitelist
+
+_PATTERNS = ["*App X has not been started*", "Failed to load resource*", "*[[]GTM[]]*", "warn?ng: *"]
+_MESSAGES = [
+    "Error: App X has not been started yet",
+    "failed to load resource: the server responded with a status of 404",
+    "[GTM] container missing",
+    "GTM container missing",
+    "Warning: deprecated API",
+    "warnung: nichts",
+    "WARNING: SHOUTING",
+    "ERROR: APP X HAS NOT BEEN STARTED",
+    "Uncaught TypeError: x is undefined",
+    "",
+]
+
+
+@pytest.mark.parametrize("message", _MESSAGES)
+def test_combined_regex_matches_like_fnmatch(message: str) -> None:
+    expected = bool(message) and any(fnmatch(message.lower(), p.lower()) for p in _PATTERNS)
+    assert Whitelist(list(_PATTERNS)).is_whitelisted(message) is expected
+
+
+def test_apply_and_reclassify_follow_pattern_changes() -> None:
+    whitelist = Whitelist([])
+    result = ScanResult(
+        url="https://ex.com/",
+        errors=[PageError(error_type=ErrorType.CONSOLE_ERROR, message="App X has not been started")],
+    )
+    assert whitelist.apply(result) == 0
+
+    whitelist.add_pattern("*has not been started*")
+    assert whitelist.apply(result) == 1
+    assert result.errors[0].whitelisted
+
+    whitelist.remove_pattern("*has not been started*")
+    whitelist.reclassify(result)
+    assert not result.errors[0].whitelisted
+
+    whitelist.patterns = ["app x*"]
+    whitelist.reclassify(result)
+    assert result.errors[0].whitelisted
+
+
+@pytest.mark.parametrize("message", _MESSAGES)
+def test_patterns_matching_lists_the_same_patterns_as_fnmatch(message: str) -> None:
+    expected = [p for p in _PATTERNS if message and fnmatch(message.lower(), p.lower())]
+    assert Whitelist(list(_PATTERNS)).patterns_matching(message) == expected
+
+
+def test_remove_patterns_matching_drops_only_the_matching_ones() -> None:
+    whitelist = Whitelist(list(_PATTERNS))
+    assert whitelist.remove_patterns_matching("Warning: deprecated API") == ["warn?ng: *"]
+    assert whitelist.patterns == [p for p in _PATTERNS if p != "warn?ng: *"]
+    assert not whitelist.is_whitelisted("Warning: deprecated API")
+
+
+def test_umlaut_patterns_still_ignore_case() -> None:
+    """Nicht-ASCII-Patterns schalten auf Unicode-Case-Folding zurueck."""
+    whitelist = Whitelist(["*ungültige eingabe*"])
+    assert whitelist.is_whitelisted("Fehler: UNGÜLTIGE Eingabe im Formular")
+    whitelist.patterns = ["*ungultige*"]
+    assert not whitelist.is_whitelisted("Fehler: UNGÜLTIGE Eingabe")
+    # ASCII-Pattern gegen eine Meldung mit Umlauten: Wildcards decken sie ab.
+    whitelist.patterns = ["fehler: *eingabe*"]
+    assert whitelist.is_whitelisted("FEHLER: ungültige EINGABE")